@@ -10,7 +10,7 @@ Example:
     >>> # Get parser for domain
     >>> parser = get_parser("komplett.no")
     >>> if parser:
-    >>>     soup = BeautifulSoup(html, 'html.parser')
+    >>>     soup = BaseExtractor.parse_html(html)
     >>>     price = parser.extract_price(soup)
     >>>
     >>> # Or use high-level API
@@ -19,16 +19,143 @@ Example:
     >>>     print(f"Price: {result.price}")
 """
 
+import ast
+import codecs
+import functools
 import importlib
+import json
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Set, Tuple, Union
+
 from bs4 import BeautifulSoup
 
-from ._base import ExtractorProtocol, ExtractorResult, BaseExtractor
+from ._base import ExtractorProtocol, ExtractorResult, BaseExtractor, SelectorCache
 
 logger = logging.getLogger(__name__)
 
+_PACKAGE = "ExtractorPatternAgent.generated_extractors"
+_PACKAGE_DIR = Path(__file__).parent
+_MANIFEST_PATH = _PACKAGE_DIR / "versions.json"
+
+# Upper bound on the default extract_many pool. Parsing and selector matching
+# mostly hold the GIL, so threads beyond one per CPU only add contention
+_MAX_DEFAULT_WORKERS = 8
+
+# Fields extracted by extract_from_html:
+# (result attribute, extractor function, label, failure severity, warn if empty)
+_FIELDS = (
+    ("price", "extract_price", "Price", "error", True),
+    ("title", "extract_title", "Title", "warning", True),
+    ("image", "extract_image", "Image", "warning", False),
+    ("availability", "extract_availability", "Availability", "warning", False),
+    ("article_number", "extract_article_number", "Article number", "warning", False),
+    ("model_number", "extract_model_number", "Model number", "warning", False),
+    ("currency", "extract_currency", "Currency", "warning", False),
+)
+
+
+def _cached_import(module_path: str) -> Any:
+    """
+    Import a module, reusing the sys.modules entry when it is already loaded.
+
+    Only falls back to importlib.import_module when the module is missing
+    or still initializing in another thread.
+
+    Args:
+        module_path: Dotted module path
+
+    Returns:
+        Imported module
+    """
+    module = sys.modules.get(module_path)
+    spec = getattr(module, "__spec__", None)
+    if module is None or spec is None or getattr(spec, "_initializing", False):
+        module = importlib.import_module(module_path)
+    return module
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_domain(domain: str) -> str:
+    """
+    Normalize a store domain for registry lookups (lowercase, no "www.").
+
+    Cached because the same few domains are looked up on every price check.
+    """
+    return domain.lower().replace("www.", "")
+
+
+def _read_metadata(file_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read PATTERN_METADATA from an extractor module without importing it.
+
+    Only the top-level assignment is evaluated (via ast.literal_eval), so
+    the module body and its compiled regexes are never executed.
+
+    Args:
+        file_path: Path to the extractor module
+
+    Returns:
+        Metadata dict or None if the module does not define one
+
+    Raises:
+        ValueError: If PATTERN_METADATA is not a literal expression
+    """
+    tree = ast.parse(file_path.read_text(encoding="utf-8"), filename=str(file_path))
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "PATTERN_METADATA" for t in targets):
+            return ast.literal_eval(node.value)
+    return None
+
+
+class _LazyModule:
+    """
+    Stand-in for an extractor module that imports it on first attribute access.
+
+    ``__name__`` is available without triggering the import, so callers that
+    only need the module name (logging, version lookups) stay cheap. A failed
+    import is remembered and re-raised, not retried on every access.
+    """
+
+    def __init__(self, name: str):
+        self.__name__ = name
+        self._mod = None
+        self._error: Optional[Exception] = None
+
+    def _load(self) -> Any:
+        if self._mod is None:
+            if self._error is not None:
+                raise self._error
+            try:
+                self._mod = _cached_import(self.__name__)
+            except Exception as e:
+                self._error = e
+                raise
+        return self._mod
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("_mod", "_error"):
+            raise AttributeError(name)
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        if self._mod is not None:
+            state = "loaded"
+        elif self._error is not None:
+            state = "failed to load"
+        else:
+            state = "not loaded"
+        return f"<lazy extractor module {self.__name__!r} ({state})>"
+
 
 class ExtractorRegistry:
     """Registry for runtime extractor discovery."""
@@ -36,24 +163,68 @@ class ExtractorRegistry:
     def __init__(self):
         self._extractors: Dict[str, Any] = {}
         self._loaded = False
+        # Domains with no extractor, so repeated misses skip the file checks
+        self._missing: Set[str] = set()
+        # module name -> (file mtime, PATTERN_METADATA) read from source
+        self._metadata_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
 
     def discover(self):
         """
         Discover all extractor modules in this package.
 
-        Scans the generated_extractors directory for Python modules
-        and registers them by domain.
+        Registers modules by domain from the versions.json manifest when it
+        is available, otherwise scans the generated_extractors directory and
+        reads each module's PATTERN_METADATA without importing it. Modules
+        are imported on first use through a _LazyModule proxy.
         """
         if self._loaded:
             return
 
         logger.debug("Discovering extractor modules...")
+        self._missing.clear()
+
+        if not self._discover_from_manifest():
+            self._discover_from_files()
+
+        self._loaded = True
+        logger.info(f"Discovered {len(self._extractors)} extractors")
+
+    def _discover_from_manifest(self) -> bool:
+        """
+        Register extractors listed in the versions.json manifest.
+
+        The manifest is regenerated by scripts/generate_versions_manifest.py
+        (pre-commit hook), so it maps every module to its domain without a
+        directory scan. Domains missing from a stale manifest are still
+        resolved by filename in get_extractor().
+
+        Returns:
+            True if the manifest was loaded, False to fall back to scanning
+        """
+        try:
+            with open(_MANIFEST_PATH, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to read extractor manifest, scanning package: {e}")
+            return False
+
+        for module_name, entry in manifest.items():
+            domain = entry.get("domain")
+            module_name = entry.get("module", module_name)
+            if domain and (_PACKAGE_DIR / f"{module_name}.py").exists():
+                self._extractors.setdefault(
+                    domain, _LazyModule(f"{_PACKAGE}.{module_name}")
+                )
+                logger.debug(f"Registered extractor for {domain}")
 
-        # Get package directory
-        package_dir = Path(__file__).parent
+        return True
 
+    def _discover_from_files(self):
+        """Scan the package directory and register modules by their metadata."""
         # Scan for .py files (excluding __init__.py and _base.py)
-        for file_path in package_dir.glob("*.py"):
+        for file_path in _PACKAGE_DIR.glob("*.py"):
             module_name = file_path.stem
 
             # Skip private/special modules
@@ -61,16 +232,14 @@ class ExtractorRegistry:
                 continue
 
             try:
-                # Import module
-                module = importlib.import_module(
-                    f"ExtractorPatternAgent.generated_extractors.{module_name}"
-                )
-
                 # Extract domain from metadata
-                if hasattr(module, "PATTERN_METADATA"):
-                    domain = module.PATTERN_METADATA.get("domain")
+                metadata = self.get_metadata(module_name)
+                if metadata is not None:
+                    domain = metadata.get("domain")
                     if domain:
-                        self._extractors[domain] = module
+                        self._extractors.setdefault(
+                            domain, _LazyModule(f"{_PACKAGE}.{module_name}")
+                        )
                         logger.debug(f"Registered extractor for {domain}")
                     else:
                         logger.warning(
@@ -84,8 +253,67 @@ class ExtractorRegistry:
             except Exception as e:
                 logger.error(f"Failed to load extractor {module_name}: {e}")
 
-        self._loaded = True
-        logger.info(f"Discovered {len(self._extractors)} extractors")
+    def _load_domain(self, domain: str) -> Optional[Any]:
+        """
+        Register the extractor for a single domain without a full discovery.
+
+        Module names follow the generator convention (dots and dashes become
+        underscores, optionally prefixed with "www_"), so the candidate files
+        can be checked directly instead of scanning every extractor.
+
+        Args:
+            domain: Normalized store domain
+
+        Returns:
+            Extractor module or None if no matching module file exists
+        """
+        base_name = domain.replace(".", "_").replace("-", "_")
+        for module_name in (base_name, f"www_{base_name}"):
+            file_path = _PACKAGE_DIR / f"{module_name}.py"
+            if not file_path.exists():
+                continue
+
+            try:
+                metadata = self.get_metadata(module_name) or {}
+            except Exception as e:
+                logger.error(f"Failed to load extractor {module_name}: {e}")
+                continue
+
+            if metadata.get("domain") == domain:
+                module = _LazyModule(f"{_PACKAGE}.{module_name}")
+                self._extractors[domain] = module
+                logger.debug(f"Registered extractor for {domain}")
+                return module
+
+        return None
+
+    def get_metadata(self, module_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get PATTERN_METADATA for an extractor module without importing it.
+
+        The metadata is parsed from the module source and cached until the
+        file's modification time changes. Modules whose PATTERN_METADATA is
+        not a plain literal are imported to read it instead.
+
+        Args:
+            module_name: Module name within this package (e.g., "komplett_no")
+
+        Returns:
+            Metadata dict or None if the module does not define one
+        """
+        file_path = _PACKAGE_DIR / f"{module_name}.py"
+        mtime = file_path.stat().st_mtime
+        cached = self._metadata_cache.get(module_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            metadata = _read_metadata(file_path)
+        except ValueError:
+            module = _cached_import(f"{_PACKAGE}.{module_name}")
+            metadata = getattr(module, "PATTERN_METADATA", None)
+        self._metadata_cache[module_name] = (mtime, metadata)
+        return metadata
 
     def get_extractor(self, domain: str) -> Optional[Any]:
         """
@@ -97,13 +325,21 @@ class ExtractorRegistry:
         Returns:
             Extractor module or None if not found
         """
-        if not self._loaded:
-            self.discover()
-
         # Normalize domain (remove www., lowercase)
-        domain = domain.lower().replace("www.", "")
+        domain = _normalize_domain(domain)
+
+        extractor = self._extractors.get(domain)
+        if extractor is None and domain not in self._missing:
+            # Resolve by filename (also covers domains missing from a stale
+            # manifest); only scan the package on a miss
+            extractor = self._load_domain(domain)
+            if extractor is None and not self._loaded:
+                self.discover()
+                extractor = self._extractors.get(domain)
+            if extractor is None:
+                self._missing.add(domain)
 
-        return self._extractors.get(domain)
+        return extractor
 
     def has_extractor(self, domain: str) -> bool:
         """
@@ -113,9 +349,16 @@ class ExtractorRegistry:
             domain: Store domain
 
         Returns:
-            True if extractor exists
+            True if an extractor exists and its module imports
         """
-        return self.get_extractor(domain) is not None
+        extractor = self.get_extractor(domain)
+        if isinstance(extractor, _LazyModule):
+            try:
+                extractor._load()
+            except Exception as e:
+                logger.error(f"Failed to load extractor for {domain}: {e}")
+                return False
+        return extractor is not None
 
     def list_domains(self) -> List[str]:
         """
@@ -136,8 +379,12 @@ class ExtractorRegistry:
         """
         logger.info("Reloading extractors...")
 
-        # Reload modules that were previously loaded
-        for domain, module in list(self._extractors.items()):
+        # Reload modules that were previously loaded; proxies that were
+        # never accessed have nothing to reload
+        for domain, extractor in list(self._extractors.items()):
+            module = sys.modules.get(extractor.__name__)
+            if module is None:
+                continue
             try:
                 importlib.reload(module)
                 logger.info(f"Reloaded extractor for {domain}")
@@ -146,6 +393,7 @@ class ExtractorRegistry:
 
         # Clear cache
         self._extractors.clear()
+        self._missing.clear()
         self._loaded = False
 
         # Re-discover
@@ -171,7 +419,7 @@ def get_parser(domain: str) -> Optional[Any]:
     Example:
         >>> parser = get_parser("komplett.no")
         >>> if parser:
-        >>>     soup = BeautifulSoup(html, 'html.parser')
+        >>>     soup = BaseExtractor.parse_html(html)
         >>>     price = parser.extract_price(soup)
         >>> else:
         >>>     print("No extractor found")
@@ -196,7 +444,33 @@ def has_parser(domain: str) -> bool:
     return _registry.has_extractor(domain)
 
 
-def extract_from_html(domain: str, html: str) -> ExtractorResult:
+def _raw_page(html: Union[str, bytes], soup: BeautifulSoup) -> Optional[Union[str, bytes]]:
+    """
+    Page text for the extractors that scan the raw HTML.
+
+    Those scanners (and orjson) read bytes as UTF-8, so undecoded bytes are
+    only kept as-is when the parser detected UTF-8 or ASCII. Any other
+    charset is decoded the way the parser decoded it.
+
+    Args:
+        html: Page as passed to extract_from_html
+        soup: The page parsed from html
+
+    Returns:
+        str or UTF-8 bytes, or None if the detected encoding is unknown
+    """
+    if isinstance(html, str):
+        return html
+    try:
+        encoding = codecs.lookup(soup.original_encoding or "utf-8").name
+    except LookupError:
+        return None
+    if encoding in ("utf-8", "ascii"):
+        return html
+    return html.decode(encoding, "replace")
+
+
+def extract_from_html(domain: str, html: Union[str, bytes]) -> ExtractorResult:
     """
     High-level extraction API.
 
@@ -205,7 +479,9 @@ def extract_from_html(domain: str, html: str) -> ExtractorResult:
 
     Args:
         domain: Store domain
-        html: HTML content to extract from
+        html: HTML content to extract from. Undecoded bytes (as fetched or
+            read from disk) go straight to lxml, which detects the encoding,
+            so callers need not decode first.
 
     Returns:
         ExtractorResult with all extracted fields and any errors/warnings
@@ -226,61 +502,93 @@ def extract_from_html(domain: str, html: str) -> ExtractorResult:
         result.errors.append(f"No extractor found for domain: {domain}")
         return result
 
-    # Parse HTML
+    # Import the module behind a lazy registry entry before parsing, so a
+    # broken extractor is reported as such rather than as a parse error
+    if isinstance(extractor, _LazyModule):
+        try:
+            extractor._load()
+        except Exception as e:
+            result.errors.append(f"Failed to load extractor: {e}")
+            return result
+
+    # Parse HTML (modules may declare a STRAINER to skip irrelevant subtrees)
     try:
-        soup = BeautifulSoup(html, "html.parser")
+        strainer = getattr(extractor, "STRAINER", None)
+        soup = BaseExtractor.parse_html(html, strainer)
     except Exception as e:
         result.errors.append(f"Failed to parse HTML: {e}")
         return result
 
+    # One selector cache per document, shared by all extract_* calls
+    SelectorCache.for_soup(soup).raw_html = _raw_page(html, soup)
+
     # Extract all fields (with error handling per field)
-    try:
-        result.price = extractor.extract_price(soup)
-        if not result.price:
-            result.warnings.append("Price not found")
-    except Exception as e:
-        result.errors.append(f"Price extraction failed: {e}")
-        logger.exception(f"Price extraction error for {domain}")
+    for attr, method, label, severity, report_missing in _FIELDS:
+        try:
+            value = getattr(extractor, method)(soup)
+            setattr(result, attr, value)
+            if report_missing and not value:
+                result.warnings.append(f"{label} not found")
+        except Exception as e:
+            if severity == "error":
+                result.errors.append(f"{label} extraction failed: {e}")
+                logger.exception(f"{label} extraction error for {domain}")
+            else:
+                result.warnings.append(f"{label} extraction failed: {e}")
 
-    try:
-        result.title = extractor.extract_title(soup)
-        if not result.title:
-            result.warnings.append("Title not found")
-    except Exception as e:
-        result.warnings.append(f"Title extraction failed: {e}")
+    return result
 
-    try:
-        result.image = extractor.extract_image(soup)
-    except Exception as e:
-        result.warnings.append(f"Image extraction failed: {e}")
 
-    try:
-        result.availability = extractor.extract_availability(soup)
-    except Exception as e:
-        result.warnings.append(f"Availability extraction failed: {e}")
+def extract_many(
+    pairs: Iterable[Tuple[str, Union[str, bytes]]], max_workers: Optional[int] = None
+) -> List[ExtractorResult]:
+    """
+    Extract from many pages concurrently.
 
-    try:
-        result.article_number = extractor.extract_article_number(soup)
-    except Exception as e:
-        result.warnings.append(f"Article number extraction failed: {e}")
+    Runs extract_from_html for each (domain, html) pair on a thread pool.
+    The extractor modules for all requested domains are imported up front so
+    worker threads do not contend on the import lock.
 
-    try:
-        result.model_number = extractor.extract_model_number(soup)
-    except Exception as e:
-        result.warnings.append(f"Model number extraction failed: {e}")
+    Args:
+        pairs: (domain, html) pairs to extract from
+        max_workers: Maximum worker threads (default: one per CPU, at most
+            _MAX_DEFAULT_WORKERS)
 
-    try:
-        result.currency = extractor.extract_currency(soup)
-    except Exception as e:
-        result.warnings.append(f"Currency extraction failed: {e}")
+    Returns:
+        ExtractorResult per pair, in input order
 
-    return result
+    Example:
+        >>> results = extract_many([("komplett.no", html1), ("oda.com", html2)])
+        >>> prices = [r.price for r in results]
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    # Warm the registry and load each module once before fanning out
+    for domain in {domain for domain, _ in pairs}:
+        extractor = get_parser(domain)
+        if isinstance(extractor, _LazyModule):
+            try:
+                extractor._load()
+            except Exception as e:
+                logger.error(f"Failed to load extractor for {domain}: {e}")
+
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, _MAX_DEFAULT_WORKERS)
+    max_workers = max(1, min(max_workers, len(pairs)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda pair: extract_from_html(*pair), pairs))
 
 
 def list_available_extractors() -> Dict[str, Dict[str, Any]]:
     """
     List all available extractors with metadata.
 
+    Metadata is parsed from each module's source (cached by file mtime),
+    so no extractor module is imported.
+
     Returns:
         Dict mapping domain to metadata
 
@@ -294,8 +602,18 @@ def list_available_extractors() -> Dict[str, Dict[str, Any]]:
     result = {}
     for domain in _registry.list_domains():
         extractor = _registry.get_extractor(domain)
-        if extractor and hasattr(extractor, "PATTERN_METADATA"):
-            result[domain] = extractor.PATTERN_METADATA
+        if not extractor:
+            continue
+
+        # Read metadata from source so listing never imports the modules
+        module_name = extractor.__name__.rsplit(".", 1)[-1]
+        try:
+            metadata = _registry.get_metadata(module_name)
+        except Exception as e:
+            logger.error(f"Failed to read metadata for {module_name}: {e}")
+            continue
+        if metadata:
+            result[domain] = metadata
 
     return result
 
@@ -315,8 +633,10 @@ __all__ = [
     "get_parser",
     "has_parser",
     "extract_from_html",
+    "extract_many",
     "list_available_extractors",
     "reload_extractors",
     "ExtractorResult",
     "BaseExtractor",
+    "SelectorCache",
 ]
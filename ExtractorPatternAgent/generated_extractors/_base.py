@@ -1,9 +1,116 @@
 """Base extractor interface for all generated extractors."""
 
-from typing import Optional, Dict, Any, Protocol
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Callable, Protocol, Union
 from decimal import Decimal
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import functools
+import json
 import re
+import weakref
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Single-character noise stripped from price strings in one C-level pass
+# (spaces, non-breaking spaces and currency symbols).
+_STRIP_TABLE = str.maketrans("", "", " \xa0$€£")
+
+# Precompiled patterns for the per-field cleaning hot path
+_NUMBER_RE = re.compile(r"\d+\.?\d*")
+# Only whitespace that collapsing would change: runs of two or more, or a
+# single non-space character (tab, newline, nbsp). Same result as \s+ -> " ",
+# but already-clean text has no match and is returned without a copy
+_WHITESPACE_RE = re.compile(r"\s{2,}|[^\S ]")
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_price_cached(text: str) -> Optional[Decimal]:
+    """Memoized body of BaseExtractor.clean_price (text is already stripped)."""
+    # Remove both regular spaces and non-breaking spaces (U+00A0) plus
+    # currency symbols; multi-character tokens are handled separately
+    text = text.translate(_STRIP_TABLE).replace("kr", "").replace(",-", "")
+
+    # Handle different decimal separators
+    # "1.990,50" -> "1990.50"
+    # "1,990.50" -> "1990.50"
+    if "," in text and "." in text:
+        # Determine which is decimal separator
+        comma_pos = text.rindex(",")
+        dot_pos = text.rindex(".")
+        if comma_pos > dot_pos:
+            # European format: 1.990,50
+            text = text.replace(".", "").replace(",", ".")
+        else:
+            # US format: 1,990.50
+            text = text.replace(",", "")
+    elif "," in text:
+        # Assume comma is decimal if only 2 digits after
+        parts = text.split(",")
+        if len(parts) == 2 and len(parts[1]) == 2:
+            text = text.replace(",", ".")
+        else:
+            # Thousand separator
+            text = text.replace(",", "")
+
+    # Extract number
+    match = _NUMBER_RE.search(text)
+    if match:
+        number = match.group()
+        if "." not in number:
+            # Integer fast path: int() is much cheaper than Decimal's parser
+            value = int(number)
+            return Decimal(value) if 0 < value < 1_000_000_000 else None
+        try:
+            price = Decimal(number)
+            # Sanity check
+            if 0 < price < 1_000_000_000:
+                return price
+        except (ValueError, ArithmeticError):
+            return None
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_text_cached(text: str) -> Optional[str]:
+    """Memoized body of BaseExtractor.clean_text (text is already stripped)."""
+    # Remove excess whitespace
+    text = _WHITESPACE_RE.sub(" ", text)
+
+    return text if text else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _index_key(selector: Any) -> Optional[str]:
+    """
+    Tag-index key shared by every subject of a compiled selector.
+
+    "div.x img" keys on "img" and ".price .amount" on ".amount". Selectors
+    whose subjects differ (or carry pseudo-class flags such as :root) get
+    None and are run as a normal tree walk.
+    """
+    # Reads soupsieve's compiled selector internals (tested with soupsieve
+    # 2.4 to 3.0); if their shape changes, fall back to the tree walk
+    try:
+        keys = set()
+        for subject in selector.selectors:
+            tag = subject.tag
+            if subject.flags or (tag and tag.prefix):
+                return None
+            if tag and tag.name != "*":
+                keys.add(tag.name.lower())
+            elif subject.classes:
+                keys.add("." + subject.classes[0])
+            else:
+                return None
+    except (AttributeError, TypeError):
+        return None
+    return keys.pop() if len(keys) == 1 else None
 
 
 class ExtractorProtocol(Protocol):
@@ -64,46 +171,8 @@ class BaseExtractor:
         if not text:
             return None
 
-        # Remove common currency symbols and whitespace
-        text = str(text).strip()
-        # Remove both regular spaces and non-breaking spaces (U+00A0)
-        text = text.replace(" ", "").replace("\xa0", "").replace("kr", "").replace("$", "")
-        text = text.replace("€", "").replace("£", "").replace(",-", "")
-
-        # Handle different decimal separators
-        # "1.990,50" -> "1990.50"
-        # "1,990.50" -> "1990.50"
-        if "," in text and "." in text:
-            # Determine which is decimal separator
-            comma_pos = text.rindex(",")
-            dot_pos = text.rindex(".")
-            if comma_pos > dot_pos:
-                # European format: 1.990,50
-                text = text.replace(".", "").replace(",", ".")
-            else:
-                # US format: 1,990.50
-                text = text.replace(",", "")
-        elif "," in text:
-            # Assume comma is decimal if only 2 digits after
-            parts = text.split(",")
-            if len(parts) == 2 and len(parts[1]) == 2:
-                text = text.replace(",", ".")
-            else:
-                # Thousand separator
-                text = text.replace(",", "")
-
-        # Extract number
-        match = re.search(r"\d+\.?\d*", text)
-        if match:
-            try:
-                price = Decimal(match.group())
-                # Sanity check
-                if 0 < price < 1_000_000_000:
-                    return price
-            except (ValueError, ArithmeticError):
-                return None
-
-        return None
+        # Plain str key: tree strings would keep their whole soup alive
+        return _clean_price_cached(str(text).strip())
 
     @staticmethod
     def clean_text(text: Optional[str]) -> Optional[str]:
@@ -119,13 +188,28 @@ class BaseExtractor:
         if not text:
             return None
 
-        # Strip whitespace
-        text = str(text).strip()
+        # Strip whitespace; plain str key, as in clean_price
+        return _clean_text_cached(str(text).strip())
 
-        # Remove excess whitespace
-        text = re.sub(r"\s+", " ", text)
+    @staticmethod
+    def normalize_url(url: Any) -> Optional[str]:
+        """
+        Normalize an image/page URL.
 
-        return text if text else None
+        Protocol-relative URLs ("//host/path") get an https: scheme; anything
+        that is not an absolute http(s) URL is rejected.
+
+        Args:
+            url: Raw URL value (non-strings are rejected)
+
+        Returns:
+            Absolute URL or None
+        """
+        if not url or not isinstance(url, str):
+            return None
+        if url.startswith("//"):
+            return "https:" + url
+        return url if url.startswith("http") else None
 
     @staticmethod
     def extract_json_field(json_data: Dict, path: str) -> Optional[Any]:
@@ -147,18 +231,29 @@ class BaseExtractor:
         if not json_data or not path:
             return None
 
+        # Skip empty keys (leading/trailing/double dots) once up front
+        keys = [key for key in path.split(".") if key]
         value = json_data
-        for key in path.split("."):
-            if not key:  # Skip empty keys
-                continue
 
+        if not any(key[0].isdigit() for key in keys):
+            # All-dict path: no list indexing possible
+            try:
+                for key in keys:
+                    value = value.get(key)
+                    if value is None:
+                        return None
+            except AttributeError:
+                return None
+            return value
+
+        for key in keys:
             if isinstance(value, dict):
                 value = value.get(key)
-            elif isinstance(value, list) and key.isdigit():
-                try:
-                    value = value[int(key)]
-                except (IndexError, ValueError):
+            elif isinstance(value, list) and key.isdecimal():
+                index = int(key)
+                if index >= len(value):
                     return None
+                value = value[index]
             else:
                 return None
 
@@ -167,21 +262,216 @@ class BaseExtractor:
 
         return value
 
+    @staticmethod
+    def parse_html(
+        html: Union[str, bytes], strainer: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
+        """
+        Parse a page once with the lxml backend.
+
+        Args:
+            html: Page HTML
+            strainer: Optional SoupStrainer limiting which elements are built
+
+        Returns:
+            Parsed soup
+        """
+        return BeautifulSoup(html, "lxml", parse_only=strainer)
+
+    @staticmethod
+    def load_json(text: Union[str, bytes]) -> Any:
+        """
+        Parse JSON, using orjson when it is installed.
+
+        Floats are returned as float; str(float) is the shortest exact
+        representation, so clean_price(str(value)) does not lose precision.
+
+        Args:
+            text: JSON document (str or bytes, including subclasses such as
+                the NavigableString of a <script> tag)
+
+        Returns:
+            Parsed value
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        if HAS_ORJSON:
+            if type(text) not in (str, bytes):
+                # orjson rejects str subclasses such as bs4's script strings
+                text = str(text) if isinstance(text, str) else bytes(text)
+            return orjson.loads(text)
+        return json.loads(text)
+
+
+class SelectorCache:
+    """
+    Per-soup memo of selector lookups shared by the extract_* functions.
+
+    The cache is attached to the soup itself, so extractors keep their
+    ``extract_*(soup)`` signature and every field extracted from the same
+    soup reuses the same lookups.
+
+    It also carries the raw HTML the soup was parsed from (when
+    extract_from_html built it) and memoizes derived data such as parsed
+    embedded JSON via memo().
+
+    Example:
+        >>> ctx = SelectorCache.for_soup(soup)
+        >>> elem = ctx('span[class*="price-default--current--"]')
+    """
+
+    _ATTR = "_selector_cache"
+
+    def __init__(self, soup: BeautifulSoup):
+        # Weak reference: the soup owns the cache, not the other way round
+        self._soup = weakref.ref(soup)
+        self._nodes: Dict[Any, Any] = {}
+        self._memo: Dict[Callable, Any] = {}
+        self._meta: Optional[Dict[str, Dict[str, Any]]] = None
+        self._index: Optional[Dict[str, list]] = None
+        self.raw_html: Optional[Union[str, bytes]] = None
+
+    @classmethod
+    def for_soup(cls, soup: BeautifulSoup) -> "SelectorCache":
+        """
+        Get the cache attached to a soup, creating it on first use.
+
+        Args:
+            soup: Parsed document
+
+        Returns:
+            SelectorCache bound to the soup
+        """
+        # Read __dict__ directly: Tag.__getattr__ would search the tree
+        cache = soup.__dict__.get(cls._ATTR)
+        if cache is None:
+            cache = cls(soup)
+            soup.__dict__[cls._ATTR] = cache
+        return cache
+
+    @property
+    def soup(self) -> BeautifulSoup:
+        """The soup this cache is bound to."""
+        return self._soup()
+
+    def select_one(self, selector: Any) -> Optional[Any]:
+        """
+        Run select_one for a selector once and reuse the result.
+
+        Args:
+            selector: CSS selector string or precompiled soupsieve selector
+
+        Returns:
+            First matching element or None
+        """
+        try:
+            return self._nodes[selector]
+        except KeyError:
+            if isinstance(selector, str):
+                node = self.soup.select_one(selector)
+            else:
+                node = selector.select_one(self.soup)
+            self._nodes[selector] = node
+            return node
+
+    __call__ = select_one
+
+    def select_first(self, selector: Any) -> Optional[Any]:
+        """
+        select_one for a precompiled selector, answered from a tag index.
+
+        The first call walks the tree once and groups every element by tag
+        name and by class. After that, each selector only tests the elements
+        that share its subject's tag (or first class), in document order,
+        instead of walking the whole tree again. This pays off when a module
+        runs many selectors against the same soup.
+        Selectors without a single indexable subject fall back to a walk.
+
+        Args:
+            selector: Precompiled soupsieve selector
+
+        Returns:
+            First matching element or None
+        """
+        try:
+            return self._nodes[selector]
+        except KeyError:
+            pass
+
+        key = _index_key(selector)
+        if key is None:
+            node = selector.select_one(self.soup)
+        else:
+            if self._index is None:
+                self._index = index = {}
+                for tag in self.soup.find_all(True):
+                    index.setdefault(tag.name, []).append(tag)
+                    classes = tag.get("class")
+                    if classes:
+                        for name in classes:
+                            index.setdefault("." + name, []).append(tag)
+            match = selector.match
+            node = next(
+                (tag for tag in self._index.get(key, ()) if match(tag)), None
+            )
+        self._nodes[selector] = node
+        return node
+
+    def meta(self, value: str, attr: str = "property") -> Optional[Any]:
+        """
+        Get the first <meta> tag whose property (or name) equals value.
+
+        All meta tags are indexed in a single pass on first use, so repeated
+        Open Graph lookups do not rescan the document.
+
+        Args:
+            value: Attribute value (e.g., "og:title")
+            attr: "property" or "name"
+
+        Returns:
+            Meta tag or None
+        """
+        if self._meta is None:
+            self._meta = {"property": {}, "name": {}}
+            for tag in self.soup.find_all("meta"):
+                for key, index in self._meta.items():
+                    key_value = tag.get(key)
+                    if isinstance(key_value, str):
+                        index.setdefault(key_value, tag)
+        return self._meta[attr].get(value)
+
+    def memo(self, factory: Callable[[BeautifulSoup], Any]) -> Any:
+        """
+        Compute factory(soup) once per soup and reuse the result (even None).
+
+        Args:
+            factory: Function deriving data from the soup
+
+        Returns:
+            Cached factory result
+        """
+        try:
+            return self._memo[factory]
+        except KeyError:
+            value = self._memo[factory] = factory(self.soup)
+            return value
+
 
+@dataclass(slots=True)
 class ExtractorResult:
     """Result from extraction attempt."""
 
-    def __init__(self, domain: str):
-        self.domain = domain
-        self.price: Optional[Decimal] = None
-        self.title: Optional[str] = None
-        self.image: Optional[str] = None
-        self.availability: Optional[str] = None
-        self.article_number: Optional[str] = None
-        self.model_number: Optional[str] = None
-        self.currency: Optional[str] = None
-        self.errors: list[str] = []
-        self.warnings: list[str] = []
+    domain: str
+    price: Optional[Decimal] = None
+    title: Optional[str] = None
+    image: Optional[str] = None
+    availability: Optional[str] = None
+    article_number: Optional[str] = None
+    model_number: Optional[str] = None
+    currency: Optional[str] = None
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -5,10 +5,11 @@ Generated on 2024-12-26 based on product page analysis.
 Extraction confidence: 0.85
 """
 import re
+import soupsieve as sv
 from decimal import Decimal
-from typing import Optional
-from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from typing import Dict, Optional, Union
+from bs4 import BeautifulSoup, SoupStrainer
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -19,38 +20,421 @@ PATTERN_METADATA = {
     'version': '1.0',
     'confidence': 0.85,
     'fields': ['price', 'title', 'image', 'availability', 'currency'],
-    'notes': 'Uses CSS selectors with Open Graph meta tag fallbacks'
+    'price_format': 'prefix_decimal_dot',
+    'notes': 'Uses window.runParams product data with CSS selector and Open Graph meta tag fallbacks'
 }
 
+# Fast path for the 'prefix_decimal_dot' price format ("NOK260.09", "260.09");
+# anything else goes through the generic BaseExtractor.clean_price
+_FAST_RE = re.compile(r'(?:[A-Z]{3})?\s*(\d+(?:\.\d+)?)')
+
+
+def _fast_clean(text: str) -> Optional[Decimal]:
+    """Parse a price in this domain's usual format, falling back to clean_price."""
+    match = _FAST_RE.fullmatch(text.strip())
+    if match:
+        price = Decimal(match.group(1))
+        return price if 0 < price < 1_000_000_000 else None
+    return BaseExtractor.clean_price(text)
+
+
+# Only these elements (with their subtrees) are built by extract_from_html;
+# <style> and <svg> blobs are skipped during parsing. Scripts are kept for
+# the window.runParams product data.
+STRAINER = SoupStrainer(['meta', 'link', 'h1', 'span', 'img', 'div', 'script'])
+
+# Text patterns, compiled once at import
+_CURRENCY_PREFIX_RE = re.compile(r'^[A-Z]{3}\s*')             # "NOK260.09" -> "260.09"
+_PRICE_CURRENCY_RE = re.compile(r'^([A-Z]{3})\s*[\d\.,]+')  # "NOK260.09" -> "NOK"
+_ITEM_ID_RE = re.compile(r'/item/(\d+)\.html')              # /item/1005003413514494.html
+_MODEL_RE = re.compile(r'^[A-Z0-9][A-Z0-9\-\.]{3,20}$')
+
+# og:price:amount and og:price:currency read from the raw HTML by
+# _raw_og_price() and _raw_og_currency()
+_PRICE_META_RE = re.compile(r'og:price:amount"[^>]*content="([^"]+)"')
+_PRICE_META_RE_BYTES = re.compile(_PRICE_META_RE.pattern.encode())
+_CURRENCY_META_RE = re.compile(r'og:price:currency"[^>]*content="([A-Z]{3})"')
+_CURRENCY_META_RE_BYTES = re.compile(_CURRENCY_META_RE.pattern.encode())
+
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call).
+# _SEL_TITLE is shared between extractors via SelectorCache.
+# Meta tags come from the SelectorCache meta index; other plain tag/attribute
+# lookups (h1, canonical) use soup.find().
+_SEL_TITLE = sv.compile('h1[data-pl="product-title"]')
+_SEL_IMAGE = sv.compile('.magnifier--image--RM17RL2, .image-view-v2--previewBox img')
+_SEL_SOLD_OUT = sv.compile('.sku-item--selected.sku-item--soldOut')
+_SEL_SPECS = sv.compile('.specification--desc--Dxx6W0W')
+
+
+# Class-substring matches ([class*="..."]) make soupsieve string-scan the
+# class attribute of every element; find() with a per-class predicate does
+# the same match in a fraction of the time
+def _is_price_class(value: Optional[str]) -> bool:
+    return value is not None and 'price-default--current--' in value
+
+
+def _find_price(soup: BeautifulSoup):
+    """Current display price span (span[class*="price-default--current--"])."""
+    return soup.find('span', class_=_is_price_class)
+
+
+def _is_availability(tag) -> bool:
+    """Match [class*="availability"], [data-availability]."""
+    return tag.has_attr('data-availability') or any(
+        'availability' in value for value in tag.get('class', ())
+    )
+
+
+# Product JSON embedded by the Next.js storefront; one JSON parse replaces
+# the selector cascade when it is present
+_NEXT_DATA_RE = re.compile(r'<script[^>]*id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+_NEXT_DATA_RE_BYTES = re.compile(_NEXT_DATA_RE.pattern.encode())
+_NEXT_DATA_PRICE_PATH = 'props.pageProps.productData.priceInfo.salePrice.minAmount.value'
+
+
+def _parse_next_data(raw: Union[str, bytes, None]) -> Optional[dict]:
+    """Parse the __NEXT_DATA__ JSON blob from raw HTML."""
+    if not raw:
+        return None
+    pattern = _NEXT_DATA_RE_BYTES if isinstance(raw, bytes) else _NEXT_DATA_RE
+    match = pattern.search(raw)
+    if not match:
+        return None
+    try:
+        data = BaseExtractor.load_json(match.group(1))
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _load_next_data(soup: BeautifulSoup) -> Optional[dict]:
+    """__NEXT_DATA__ for a soup, from the raw HTML or the script element."""
+    raw = SelectorCache.for_soup(soup).raw_html
+    if raw is None:
+        script = soup.find('script', id='__NEXT_DATA__')
+        raw = str(script) if script else None
+    return _parse_next_data(raw)
+
+
+def _next_data_price(data: Optional[dict]) -> Optional[Decimal]:
+    """Sale price from parsed __NEXT_DATA__."""
+    value = BaseExtractor.extract_json_field(data, _NEXT_DATA_PRICE_PATH)
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return _fast_clean(str(value))
+
+
+# Storefront state assigned in an inline script: window.runParams = {"data": {...}}.
+# Parsed once per soup and shared by all extract_* functions.
+_RUN_PARAMS_ANCHOR_RE = re.compile(r'window\.runParams\s*=\s*')
+
+# Balanced-brace scan token: everything up to the next structural brace in
+# one regex step. String literals are consumed whole (so braces and
+# semicolons inside strings are skipped), which leaves the per-token Python
+# work to the braces alone. The token cannot fail: an unterminated string or
+# a missing brace runs to the end of the text, so a truncated payload costs
+# one linear pass instead of a retry at every position.
+_JSON_SCAN_RE = re.compile(
+    r'(?:[^{}"]++|"[^"\\]*+(?:\\.[^"\\]*+)*+"?)*+([{}]|\Z)', re.DOTALL
+)
+
+# Object key immediately before an opening brace ("name": {)
+_OBJECT_KEY_RE = re.compile(r'("\w+")\s*:\s*$')
+_OBJECT_KEY_WINDOW = 64
+
+# The runParams.data modules the extractors read. The payload is often several
+# hundred KB of modules we never look at; only these are decoded.
+_RUN_PARAMS_MODULES = (
+    'actionModule',
+    'commonModule',
+    'imageModule',
+    'priceModule',
+    'quantityModule',
+    'specsModule',
+    'titleModule',
+)
+
+_SCAN_PATTERNS = {
+    str: (
+        _RUN_PARAMS_ANCHOR_RE,
+        _JSON_SCAN_RE,
+        _OBJECT_KEY_RE,
+        '{',
+        '"data"',
+        {f'"{name}"': name for name in _RUN_PARAMS_MODULES},
+    ),
+    bytes: (
+        re.compile(_RUN_PARAMS_ANCHOR_RE.pattern.encode()),
+        re.compile(_JSON_SCAN_RE.pattern.encode(), re.DOTALL),
+        re.compile(_OBJECT_KEY_RE.pattern.encode()),
+        b'{',
+        b'"data"',
+        {f'"{name}"'.encode(): name for name in _RUN_PARAMS_MODULES},
+    ),
+}
+
+
+def _object_key(key_re, text: Union[str, bytes], pos: int) -> Optional[Union[str, bytes]]:
+    """Quoted key of the object opening at pos, if any."""
+    match = key_re.search(text, max(0, pos - _OBJECT_KEY_WINDOW), pos)
+    return match.group(1) if match else None
+
+
+def _scan_run_params(text: Union[str, bytes]) -> Optional[Dict[str, Union[str, bytes]]]:
+    """
+    Slice the wanted data modules out of the window.runParams object.
+
+    Single pass from the assignment anchor to the matching close brace,
+    tracking object depth: keys of the top-level object sit at depth 1 and
+    the modules of "data" at depth 2.
+
+    Returns:
+        Raw JSON text per module name, or None if there is no complete
+        runParams object with a "data" object
+    """
+    kind = bytes if isinstance(text, bytes) else str
+    anchor_re, scan_re, key_re, open_brace, data_key, wanted = _SCAN_PATTERNS[kind]
+    anchor = anchor_re.search(text)
+    if not anchor:
+        return None
+
+    start = anchor.end()
+    if text[start:start + 1] != open_brace:
+        return None
+
+    depth = 0
+    in_data = seen_data = False
+    module = None
+    module_start = 0
+    slices = {}
+    for token in scan_re.finditer(text, start):
+        brace = token.group(1)
+        if not brace:
+            # End of text before the object closed
+            return None
+        pos = token.start(1)
+        if brace == open_brace:
+            depth += 1
+            if depth == 2:
+                in_data = _object_key(key_re, text, pos) == data_key
+                seen_data = seen_data or in_data
+            elif depth == 3 and in_data:
+                module = wanted.get(_object_key(key_re, text, pos))
+                module_start = pos
+        else:
+            depth -= 1
+            if depth == 2 and module is not None:
+                # Duplicate keys: the last one wins, as with a full parse
+                slices[module] = text[module_start:pos + 1]
+                module = None
+            elif depth == 0:
+                return slices if seen_data else None
+    return None
+
+
+def _parse_run_params(text: Union[str, bytes, None]) -> Optional[dict]:
+    """
+    Parse the product modules ("data") from a window.runParams assignment.
+
+    Only the modules in _RUN_PARAMS_MODULES are decoded; the result has the
+    same shape as the full "data" object for every path the extractors read.
+    """
+    if not text:
+        return None
+    slices = _scan_run_params(text)
+    if slices is None:
+        return None
+    data = {}
+    for name, payload in slices.items():
+        try:
+            data[name] = BaseExtractor.load_json(payload)
+        except ValueError:
+            continue
+    return data
+
+
+def _has_run_params(text: Optional[str]) -> bool:
+    """String filter for the script that assigns window.runParams."""
+    return bool(text) and 'window.runParams' in text
+
+
+def _load_run_params(soup: BeautifulSoup) -> Optional[dict]:
+    """Find and parse the window.runParams script in a soup."""
+    raw = SelectorCache.for_soup(soup).raw_html
+    if raw is not None:
+        # The page text is at hand: one anchored scan, no script walk
+        return _parse_run_params(raw)
+
+    # The string= filter runs the substring check during the tree walk, so
+    # only the matching script's text is read afterwards
+    script = soup.find('script', string=_has_run_params)
+    return _parse_run_params(script.string or script.get_text()) if script else None
+
+
+def _get_run_params(soup: BeautifulSoup) -> Optional[dict]:
+    """
+    window.runParams product modules, parsed at most once per soup.
+
+    A miss is memoized as None too, so on pages without runParams
+    (bot-challenge HTML, mobile variant) the script scan runs once and every
+    _run_params_* helper returns immediately.
+    """
+    return SelectorCache.for_soup(soup).memo(_load_run_params)
+
+
+def _run_params_price(data: Optional[dict]) -> Optional[Decimal]:
+    """Current (activity) price, falling back to the regular minimum price."""
+    if not data:
+        return None
+    for path in ('priceModule.minActivityAmount.value', 'priceModule.minAmount.value'):
+        value = BaseExtractor.extract_json_field(data, path)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            # JSON number: no text to clean, and str(float) is exact
+            price = Decimal(str(value))
+            return price if price.is_finite() and 0 < price < 1_000_000_000 else None
+        if isinstance(value, str):
+            return _fast_clean(value)
+    return None
+
+
+def _run_params_currency(data: Optional[dict]) -> Optional[str]:
+    """Currency code of the current price."""
+    if not data:
+        return None
+    for path in (
+        'priceModule.minActivityAmount.currency',
+        'priceModule.minAmount.currency',
+        'commonModule.currencyCode',
+    ):
+        value = BaseExtractor.extract_json_field(data, path)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _run_params_title(data: Optional[dict]) -> Optional[str]:
+    """Product title (titleModule.subject)."""
+    if not data:
+        return None
+    value = BaseExtractor.extract_json_field(data, 'titleModule.subject')
+    return BaseExtractor.clean_text(value) if isinstance(value, str) else None
+
+
+def _run_params_availability(data: Optional[dict]) -> Optional[str]:
+    """Stock status from the total available quantity."""
+    if not data:
+        return None
+    quantity = BaseExtractor.extract_json_field(data, 'quantityModule.totalAvailQuantity')
+    if not isinstance(quantity, int) or isinstance(quantity, bool):
+        return None
+    return "In Stock" if quantity > 0 else "Out of Stock"
+
+
+def _raw_og_price(raw: Union[str, bytes, None]) -> Optional[Decimal]:
+    """
+    og:price:amount read straight from the raw HTML.
+
+    Only used when the page has no price display span, which outranks the
+    meta tag in extract_price().
+    """
+    if not raw:
+        return None
+    if isinstance(raw, bytes):
+        if b'price-default--current--' in raw:
+            return None
+        match = _PRICE_META_RE_BYTES.search(raw)
+        content = match.group(1).decode('utf-8', 'replace') if match else None
+    else:
+        if 'price-default--current--' in raw:
+            return None
+        match = _PRICE_META_RE.search(raw)
+        content = match.group(1) if match else None
+    return _fast_clean(content) if content else None
+
+
+def _raw_og_currency(raw: Union[str, bytes, None]) -> Optional[str]:
+    """
+    og:price:currency read straight from the raw HTML.
+
+    Like _raw_og_price(), only used when the page has no price display span,
+    whose currency prefix outranks the meta tag in extract_currency().
+    """
+    if not raw:
+        return None
+    if isinstance(raw, bytes):
+        if b'price-default--current--' in raw:
+            return None
+        match = _CURRENCY_META_RE_BYTES.search(raw)
+        return match.group(1).decode('ascii') if match else None
+    if 'price-default--current--' in raw:
+        return None
+    match = _CURRENCY_META_RE.search(raw)
+    return match.group(1) if match else None
+
+
+def _raw_may_be_sold_out(raw: Union[str, bytes, None]) -> bool:
+    """
+    Whether the page could have a sold-out SKU, judged from the raw HTML.
+
+    Most pages never mention the soldOut class, so checking for it skips the
+    tree walk for the selected sold-out SKU.
+    """
+    if raw is None:
+        return True
+    if isinstance(raw, bytes):
+        return b'sku-item--soldOut' in raw
+    return 'sku-item--soldOut' in raw
+
 
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
     Extract current price from AliExpress product page.
     
     Strategy:
-    1. Try price display span: .price-default--current--*
-    2. Fallback to og:price:amount meta tag
+    1. Try embedded __NEXT_DATA__ product JSON (sale price)
+    2. Try og:price:amount in the raw HTML when no price span is rendered
+       (avoids parsing runParams for the common case)
+    3. Try window.runParams priceModule
+    4. Try price display span: .price-default--current--*
+    5. Fallback to og:price:amount meta tag
     
     Sample value: NOK260.09
     Confidence: 0.90
     """
+    ctx = SelectorCache.for_soup(soup)
+    price = _next_data_price(ctx.memo(_load_next_data))
+    if price is not None:
+        return price
+    
+    if ctx.raw_html is not None:
+        price = _raw_og_price(ctx.raw_html)
+    elif ctx.memo(_find_price) is None:
+        meta = ctx.meta('og:price:amount')
+        price = _fast_clean(meta['content']) if meta and meta.get('content') else None
+    if price is not None:
+        return price
+    
+    price = _run_params_price(_get_run_params(soup))
+    if price is not None:
+        return price
+    
     # Primary selector - current display price
-    elem = soup.select_one('span[class*="price-default--current--"]')
+    elem = SelectorCache.for_soup(soup).memo(_find_price)
     if elem:
         text = elem.get_text()
-        # Remove currency code prefix if present (e.g., "NOK260.09")
-        text = re.sub(r'^[A-Z]{3}\s*', '', text)
-        return BaseExtractor.clean_price(text)
+        # Currency code prefix (e.g., "NOK260.09") is handled by _fast_clean;
+        # strip it for the generic fallback
+        return _fast_clean(_CURRENCY_PREFIX_RE.sub('', text))
     
     # Fallback to Open Graph price meta tag
-    meta = soup.select_one('meta[property="og:price:amount"]')
+    meta = SelectorCache.for_soup(soup).meta('og:price:amount')
     if meta and meta.get('content'):
-        return BaseExtractor.clean_price(meta['content'])
+        return _fast_clean(meta['content'])
     
     # Fallback to data-price attribute
-    elem_data = soup.select_one('[data-price]')
+    elem_data = soup.find(attrs={'data-price': True})
     if elem_data and elem_data.get('data-price'):
-        return BaseExtractor.clean_price(elem_data['data-price'])
+        return _fast_clean(elem_data['data-price'])
     
     return None
 
@@ -60,25 +444,30 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Extract product title.
     
     Strategy:
-    1. Try h1 with data-pl="product-title"
-    2. Fallback to og:title meta tag
-    3. Fallback to any h1 on the page
+    1. Try window.runParams titleModule
+    2. Try h1 with data-pl="product-title"
+    3. Fallback to og:title meta tag
+    4. Fallback to any h1 on the page
     
     Sample: "UGREEN 65W GaN Charger Quick Charge 4.0 3.0 Type C PD Fast Phone Charger USB Charger For Macbook Pro Laptop iPhone 17 15 15 Pro"
     Confidence: 0.95
     """
+    title = _run_params_title(_get_run_params(soup))
+    if title:
+        return title
+    
     # Primary selector - h1 with data attribute
-    elem = soup.select_one('h1[data-pl="product-title"]')
+    elem = SelectorCache.for_soup(soup)(_SEL_TITLE)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
     
     # Fallback to Open Graph title
-    meta = soup.select_one('meta[property="og:title"]')
+    meta = SelectorCache.for_soup(soup).meta('og:title')
     if meta and meta.get('content'):
         return BaseExtractor.clean_text(meta['content'])
     
     # Last fallback - any h1
-    elem = soup.select_one('h1')
+    elem = soup.find('h1')
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
     
@@ -92,23 +481,29 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Strategy:
     1. Try og:image:secure_url meta tag (preferred - HTTPS)
     2. Fallback to og:image meta tag
-    3. Fallback to main product image selector
+    3. Fallback to window.runParams imageModule
+    4. Fallback to main product image selector
     
     Sample: "https://ae-pic-a1.aliexpress-media.com/kf/S81584d9529a649faa86e3280dfd55b66h.jpg_960x960q75.jpg_.avif"
     Confidence: 0.95
     """
-    # Primary - secure Open Graph image
-    meta = soup.select_one('meta[property="og:image:secure_url"]')
-    if meta and meta.get('content'):
-        return meta['content']
-    
-    # Fallback to regular og:image
-    meta = soup.select_one('meta[property="og:image"]')
-    if meta and meta.get('content'):
-        return meta['content']
+    # Primary - secure Open Graph image, then regular og:image
+    ctx = SelectorCache.for_soup(soup)
+    for prop in ('og:image:secure_url', 'og:image'):
+        meta = ctx.meta(prop)
+        image = BaseExtractor.normalize_url(meta.get('content') if meta else None)
+        if image:
+            return image
+    
+    # Fallback to first gallery image (protocol-relative URLs)
+    image = BaseExtractor.normalize_url(BaseExtractor.extract_json_field(
+        _get_run_params(soup), 'imageModule.imagePathList.0'
+    ))
+    if image:
+        return image
     
     # Fallback to main product image
-    img = soup.select_one('.magnifier--image--RM17RL2, .image-view-v2--previewBox img')
+    img = _SEL_IMAGE.select_one(soup)
     if img and img.get('src'):
         return img['src']
     
@@ -121,8 +516,9 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     
     Strategy:
     1. Check if selected SKU has soldOut class
-    2. Check for availability text/indicators
-    3. Default to "In Stock" if product page loads successfully
+    2. Check window.runParams total available quantity
+    3. Check for availability text/indicators
+    4. Default to "In Stock" if product page loads successfully
     
     AliExpress shows sold out variants with class "sku-item--soldOut"
     The selected variant has class "sku-item--selected"
@@ -131,12 +527,16 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.80
     """
     # Check if the currently selected SKU is sold out
-    selected_sold_out = soup.select_one('.sku-item--selected.sku-item--soldOut')
-    if selected_sold_out:
+    raw = SelectorCache.for_soup(soup).raw_html
+    if _raw_may_be_sold_out(raw) and _SEL_SOLD_OUT.select_one(soup):
         return "Out of Stock"
     
+    availability = _run_params_availability(_get_run_params(soup))
+    if availability:
+        return availability
+    
     # Check for any availability indicators
-    availability_text = soup.select_one('[class*="availability"], [data-availability]')
+    availability_text = soup.find(_is_availability)
     if availability_text:
         text = BaseExtractor.clean_text(availability_text.get_text())
         if text:
@@ -144,7 +544,7 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     
     # If the product page loaded and no sold-out indicator, assume in stock
     # (AliExpress typically removes completely unavailable items)
-    title_elem = soup.select_one('h1[data-pl="product-title"]')
+    title_elem = SelectorCache.for_soup(soup)(_SEL_TITLE)
     if title_elem:
         return "In Stock"
     
@@ -160,20 +560,27 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.60
     """
+    # Product ID from window.runParams
+    data = _get_run_params(soup)
+    for path in ('commonModule.productId', 'actionModule.productId'):
+        product_id = BaseExtractor.extract_json_field(data, path)
+        if isinstance(product_id, (int, str)) and not isinstance(product_id, bool):
+            return str(product_id)
+    
     # Try to extract from URL pattern in canonical link
-    canonical = soup.select_one('link[rel="canonical"]')
+    canonical = soup.find('link', rel='canonical')
     if canonical and canonical.get('href'):
         url = canonical['href']
         # AliExpress URLs like: /item/1005003413514494.html
-        match = re.search(r'/item/(\d+)\.html', url)
+        match = _ITEM_ID_RE.search(url)
         if match:
             return match.group(1)
     
     # Try og:url as well
-    meta = soup.select_one('meta[property="og:url"]')
+    meta = SelectorCache.for_soup(soup).meta('og:url')
     if meta and meta.get('content'):
         url = meta['content']
-        match = re.search(r'/item/(\d+)\.html', url)
+        match = _ITEM_ID_RE.search(url)
         if match:
             return match.group(1)
     
@@ -189,12 +596,20 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.50
     """
+    # Specification properties from window.runParams
+    props = BaseExtractor.extract_json_field(_get_run_params(soup), 'specsModule.props')
+    for prop in props if isinstance(props, list) else []:
+        if isinstance(prop, dict) and prop.get('attrName') in ('Model Number', 'Model'):
+            value = BaseExtractor.clean_text(str(prop.get('attrValue') or ''))
+            if value:
+                return value
+    
     # Look in specifications section
-    specs = soup.select('.specification--desc--Dxx6W0W')
+    specs = _SEL_SPECS.select(soup)
     for spec in specs:
         text = spec.get_text()
         # Look for patterns like model numbers (alphanumeric with dashes/dots)
-        if re.match(r'^[A-Z0-9][A-Z0-9\-\.]{3,20}$', text):
+        if _MODEL_RE.match(text):
             return text
     
     return None
@@ -205,23 +620,35 @@ def extract_currency(soup: BeautifulSoup) -> Optional[str]:
     Extract currency code.
     
     Strategy:
-    1. Extract from price display text prefix
-    2. Fallback to og:price:currency meta tag
-    3. Default to common currency for region
+    1. Extract from window.runParams priceModule
+    2. Try og:price:currency in the raw HTML when no price span is rendered
+    3. Extract from price display text prefix
+    4. Fallback to og:price:currency meta tag
+    5. Default to common currency for region
     
     Sample: "NOK" (Norwegian Krone)
     Confidence: 0.90
     """
+    currency = _run_params_currency(_get_run_params(soup))
+    if currency:
+        return currency
+    
+    # og:price:currency straight from the raw HTML when no price span is
+    # rendered (skips the span search)
+    currency = _raw_og_currency(SelectorCache.for_soup(soup).raw_html)
+    if currency:
+        return currency
+    
     # Try to extract from price text
-    elem = soup.select_one('span[class*="price-default--current--"]')
+    elem = SelectorCache.for_soup(soup).memo(_find_price)
     if elem:
         text = elem.get_text()
-        match = re.match(r'^([A-Z]{3})\s*[\d\.,]+', text)
+        match = _PRICE_CURRENCY_RE.match(text)
         if match:
             return match.group(1)
     
     # Fallback to Open Graph currency
-    meta = soup.select_one('meta[property="og:price:currency"]')
+    meta = SelectorCache.for_soup(soup).meta('og:price:currency')
     if meta and meta.get('content'):
         return meta['content']
     
@@ -5,11 +5,9 @@ Converted from JSON pattern on 2025-12-17T16:02:31.859862
 Original confidence: 0.00
 """
 
-import re
 from decimal import Decimal
 from typing import Optional
 from bs4 import BeautifulSoup
-from ._base import BaseExtractor
 
 
 # Metadata (required for discovery)
@@ -4,7 +4,6 @@ Auto-generated extractor for www.example.com
 Converted from JSON pattern on 2025-12-17T15:55:12.744092
 Original confidence: 0.00
 """
-import re
 from decimal import Decimal
 from typing import Optional
 from bs4 import BeautifulSoup
@@ -36,7 +35,7 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.85
     """
     # Primary selector
-    elem = soup.select_one('h1')
+    elem = soup.find('h1')
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -5,13 +5,13 @@ Generated on 2025-12-21 for product extraction.
 Uses JSON-LD structured data as primary source.
 """
 
-import json
+import re
 from decimal import Decimal
-from typing import Optional, Any
+from typing import Iterable, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 PATTERN_METADATA = {
@@ -31,21 +31,64 @@ PATTERN_METADATA = {
     "notes": "JSON-LD Product schema with meta tag fallbacks. High confidence due to structured data.",
 }
 
+# extract_from_html only builds meta tags, the h1 title fallback and the
+# scripts; the JSON-LD is read from the raw HTML it stores on the
+# SelectorCache, and from the script nodes only when a raw block fails
+STRAINER = SoupStrainer(["meta", "h1", "script"])
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+_JSON_LD_RE_BYTES = re.compile(_JSON_LD_RE.pattern.encode(), re.DOTALL | re.IGNORECASE)
+
 
 def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
-    """Extract Product JSON-LD structured data from the page."""
-    script = soup.select_one("script[type='application/ld+json']")
-    if not script or not script.string:
-        return None
-    
-    try:
-        data = json.loads(script.string)
+    """Product JSON-LD for the page, parsed once and shared by all extractors."""
+    return SelectorCache.for_soup(soup).memo(_load_product_json_ld)
+
+
+def _load_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
+    """Extract the first Product JSON-LD block from the page."""
+    raw = SelectorCache.for_soup(soup).raw_html
+    if raw is not None:
+        # Scan the raw page for JSON-LD islands instead of the DOM
+        pattern = _JSON_LD_RE_BYTES if isinstance(raw, bytes) else _JSON_LD_RE
+        marker = b'"Product"' if isinstance(raw, bytes) else '"Product"'
+        blocks = (match.group(1) for match in pattern.finditer(raw))
+        try:
+            return _first_product(blocks, marker, strict=True)
+        except (TypeError, ValueError):
+            # A block that does not decode as sliced from the raw page is
+            # read again from the tree, which lxml decoded with the page charset
+            pass
+
+    blocks = (
+        script.string or script.get_text()
+        for script in soup.find_all("script", type="application/ld+json")
+    )
+    return _first_product(blocks, '"Product"', strict=False)
+
+
+def _first_product(blocks: Iterable, marker, strict: bool) -> Optional[dict]:
+    """
+    Return the first Product among JSON-LD blocks.
+
+    Only blocks that can hold a Product are parsed. Undecodable blocks are
+    skipped, or their error is re-raised when strict.
+    """
+    for block in blocks:
+        if not block or marker not in block:
+            continue
+        try:
+            data = BaseExtractor.load_json(block)
+        except (TypeError, ValueError):
+            if strict:
+                raise
+            continue
         # Check if this is a Product type
         if isinstance(data, dict) and data.get("@type") == "Product":
             return data
-    except (json.JSONDecodeError, TypeError, ValueError):
-        pass
-    
+
     return None
 
 
@@ -83,11 +126,15 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
         offers = product.get("offers")
         if isinstance(offers, dict):
             price = offers.get("price")
+            if isinstance(price, (int, float)) and not isinstance(price, bool):
+                # JSON number: no text to clean, and str(float) is exact
+                price = Decimal(str(price))
+                return price if price.is_finite() and 0 < price < 1_000_000_000 else None
             if price is not None:
                 return BaseExtractor.clean_price(str(price))
     
     # Fallback: Open Graph price meta tag
-    elem = soup.select_one("meta[property='og:price:amount']")
+    elem = SelectorCache.for_soup(soup).meta("og:price:amount")
     if elem:
         value = elem.get("content")
         if value:
@@ -110,7 +157,7 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
             return BaseExtractor.clean_text(name)
     
     # Fallback 1: Open Graph title meta tag
-    elem = soup.select_one("meta[property='og:title']")
+    elem = SelectorCache.for_soup(soup).meta("og:title")
     if elem:
         value = elem.get("content")
         if value:
@@ -122,7 +169,7 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
             return value
     
     # Fallback 2: h1 heading
-    elem = soup.select_one("h1")
+    elem = soup.find("h1")
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
     
@@ -140,18 +187,17 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     if product:
         image = product.get("image")
         # Handle both list and string formats
-        if isinstance(image, list) and image:
-            image_url = image[0]
-            if isinstance(image_url, str) and image_url.startswith("http"):
-                return image_url
-        elif isinstance(image, str) and image.startswith("http"):
+        if isinstance(image, list):
+            image = image[0] if image else None
+        image = BaseExtractor.normalize_url(image)
+        if image:
             return image
     
     # Fallback: Open Graph image meta tag
-    elem = soup.select_one("meta[property='og:image']")
+    elem = SelectorCache.for_soup(soup).meta("og:image")
     if elem:
-        value = elem.get("content")
-        if value and value.startswith("http"):
+        value = BaseExtractor.normalize_url(elem.get("content"))
+        if value:
             return value
     
     return None
@@ -6,10 +6,11 @@ WooCommerce site with Woodmart theme, variable products
 """
 
 import re
+import soupsieve as sv
 from decimal import Decimal
 from typing import Optional
-from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from bs4 import BeautifulSoup, SoupStrainer
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -31,6 +32,84 @@ PATTERN_METADATA = {
     "notes": "WooCommerce site with Woodmart theme, variable products with price ranges",
 }
 
+# Tags the selectors below start from; matched tags keep their whole subtree,
+# so descendant selectors (span.woocs_price_code ... bdi) still resolve
+STRAINER = SoupStrainer(
+    ["script", "meta", "link", "h1", "p", "span", "div", "img", "button", "a"]
+)
+
+_PRODUCT_DIV_ID_RE = re.compile(r"product-(\d+)")
+_PRODUCT_ID_JSON_RE = re.compile(r'"product_id":\s*(\d+)')
+
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call),
+# answered through SelectorCache.select_first's per-soup tag index
+_SEL_WOOCS_PRICE = sv.compile("span.woocs_price_code .woocommerce-Price-amount bdi")
+_SEL_SALE_PRICE = sv.compile("p.price ins .woocommerce-Price-amount")
+_SEL_PRICE = sv.compile("p.price .woocommerce-Price-amount")
+_SEL_ENTRY_TITLE = sv.compile("h1.product_title.entry-title")
+_SEL_TITLE = sv.compile("h1.product_title")
+_SEL_GALLERY_IMAGE = sv.compile("div.woocommerce-product-gallery__image img")
+_SEL_POST_IMAGE = sv.compile("img.wp-post-image")
+_SEL_PRODUCT_DIV = sv.compile("div.product")
+_SEL_AVAILABILITY_LINK = sv.compile('link[itemprop="availability"]')
+_SEL_PRODUCT_ID = sv.compile("button[data-product_id], a[data-product_id]")
+_SEL_PRODUCT_DIV_ID = sv.compile("div.product[id]")
+_SEL_SKU = sv.compile("span.sku")
+_SEL_PRODUCT_SKU = sv.compile("button[data-product_sku], a[data-product_sku]")
+_SEL_META_SKU = sv.compile('meta[itemprop="sku"]')
+
+# Schema.org/OpenGraph availability values; group names are the return values,
+# and IGNORECASE replaces a lowercased copy of the value
+_AVAILABILITY_RE = re.compile(
+    r"(?P<in_stock>instock|in stock)|(?P<out_of_stock>outofstock|out of stock)",
+    re.IGNORECASE,
+)
+
+
+# Image attributes in priority order: full resolution, lazy-load, plain src
+_IMAGE_ATTRS = ("data-large_image", "data-src", "src")
+
+
+def _image_url(elem) -> Optional[str]:
+    """First populated image attribute of elem, if it is an absolute URL."""
+    attrs = elem.attrs
+    for name in _IMAGE_ATTRS:
+        url = attrs.get(name)
+        if url:
+            return url if url.startswith("http") else None
+    return None
+
+
+def _button_or_link_attr(soup: BeautifulSoup, selector, attr: str) -> Optional[str]:
+    """
+    attr of the first matching <button>, else of the first <a>.
+
+    One walk over a comma-joined selector replaces a button lookup followed
+    by a link lookup. Groups match in document order, so the button is
+    still preferred explicitly (mini-cart links come before the main button).
+    """
+    button = link = None
+    for elem in selector.iselect(soup):
+        if elem.name == "button":
+            if button is None:
+                button = elem
+                if elem.get(attr):
+                    break
+        elif link is None:
+            link = elem
+        if button is not None and link is not None:
+            break
+
+    for elem in (button, link):
+        if elem is not None and elem.get(attr):
+            return elem[attr]
+    return None
+
+
+def _has_product_id(text: Optional[str]) -> bool:
+    """String filter for inline scripts that mention product_id."""
+    return bool(text) and '"product_id"' in text
+
 
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
@@ -45,34 +124,36 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
 
     Note: For variable products with price ranges, extracts the minimum price.
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: WOOCS price code (handles currency switcher)
     # For variable products with price ranges, get the first woocommerce-Price-amount (minimum price)
-    elem = soup.select_one("span.woocs_price_code .woocommerce-Price-amount bdi")
+    elem = ctx.select_first(_SEL_WOOCS_PRICE)
     if elem:
         price = BaseExtractor.clean_price(elem.get_text())
         if price:
             return price
 
     # Fallback 1: WooCommerce sale price (ins tag indicates sale)
-    elem = soup.select_one("p.price ins .woocommerce-Price-amount")
+    elem = ctx.select_first(_SEL_SALE_PRICE)
     if elem:
         price = BaseExtractor.clean_price(elem.get_text())
         if price:
             return price
 
     # Fallback 2: Regular WooCommerce price
-    elem = soup.select_one("p.price .woocommerce-Price-amount")
+    elem = ctx.select_first(_SEL_PRICE)
     if elem:
         price = BaseExtractor.clean_price(elem.get_text())
         if price:
             return price
 
     # Fallback 3: OpenGraph meta tag
-    meta = soup.select_one('meta[property="product:price:amount"]')
+    meta = ctx.meta("product:price:amount")
     if meta and meta.get("content"):
         try:
             return Decimal(meta["content"])
-        except:
+        except (ValueError, ArithmeticError):
             pass
 
     return None
@@ -88,18 +169,20 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
 
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: WooCommerce product title
-    elem = soup.select_one("h1.product_title.entry-title")
+    elem = ctx.select_first(_SEL_ENTRY_TITLE)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
     # Fallback 1: Any product_title h1
-    elem = soup.select_one("h1.product_title")
+    elem = ctx.select_first(_SEL_TITLE)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
     # Fallback 2: OpenGraph title
-    meta = soup.select_one('meta[property="og:title"]')
+    meta = ctx.meta("og:title")
     if meta and meta.get("content"):
         return BaseExtractor.clean_text(meta["content"])
 
@@ -116,23 +199,24 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
 
     Confidence: 0.92
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: First image in WooCommerce gallery
-    elem = soup.select_one("div.woocommerce-product-gallery__image img")
+    elem = ctx.select_first(_SEL_GALLERY_IMAGE)
     if elem:
-        # Try data-large_image first (full resolution), then data-src, then src
-        url = elem.get("data-large_image") or elem.get("data-src") or elem.get("src")
-        if url and url.startswith("http"):
+        url = _image_url(elem)
+        if url:
             return url
 
     # Fallback 1: WordPress post image
-    elem = soup.select_one("img.wp-post-image")
+    elem = ctx.select_first(_SEL_POST_IMAGE)
     if elem:
-        url = elem.get("data-large_image") or elem.get("data-src") or elem.get("src")
-        if url and url.startswith("http"):
+        url = _image_url(elem)
+        if url:
             return url
 
     # Fallback 2: OpenGraph image
-    meta = soup.select_one('meta[property="og:image"]')
+    meta = ctx.meta("og:image")
     if meta and meta.get("content"):
         url = meta["content"]
         if url.startswith("http"):
@@ -153,8 +237,10 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
 
     Returns: 'in_stock', 'out_of_stock', or None
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: WooCommerce stock status classes
-    product_div = soup.select_one("div.product")
+    product_div = ctx.select_first(_SEL_PRODUCT_DIV)
     if product_div:
         classes = product_div.get("class", [])
         if "instock" in classes:
@@ -163,22 +249,18 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
             return "out_of_stock"
 
     # Fallback 1: Schema.org availability link
-    elem = soup.select_one('link[itemprop="availability"]')
+    elem = ctx.select_first(_SEL_AVAILABILITY_LINK)
     if elem and elem.get("href"):
-        href = elem["href"].lower()
-        if "instock" in href:
-            return "in_stock"
-        elif "outofstock" in href:
-            return "out_of_stock"
+        match = _AVAILABILITY_RE.search(elem["href"])
+        if match:
+            return match.lastgroup
 
     # Fallback 2: OpenGraph availability
-    meta = soup.select_one('meta[property="product:availability"]')
+    meta = ctx.meta("product:availability")
     if meta and meta.get("content"):
-        content = meta["content"].lower()
-        if "instock" in content or "in stock" in content:
-            return "in_stock"
-        elif "outofstock" in content or "out of stock" in content:
-            return "out_of_stock"
+        match = _AVAILABILITY_RE.search(meta["content"])
+        if match:
+            return match.lastgroup
 
     return None
 
@@ -193,32 +275,28 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
 
     Confidence: 0.85
     """
-    # Primary: WooCommerce add-to-cart button product_id
-    elem = soup.select_one("button[data-product_id]")
-    if elem and elem.get("data-product_id"):
-        return elem["data-product_id"]
+    ctx = SelectorCache.for_soup(soup)
 
-    # Also check anchor tags with data-product_id
-    elem = soup.select_one("a[data-product_id]")
-    if elem and elem.get("data-product_id"):
-        return elem["data-product_id"]
+    # Primary: WooCommerce add-to-cart button product_id, then anchor tags
+    product_id = _button_or_link_attr(soup, _SEL_PRODUCT_ID, "data-product_id")
+    if product_id:
+        return product_id
 
     # Fallback 1: Product div ID (format: product-1481)
-    elem = soup.select_one("div.product[id]")
+    elem = ctx.select_first(_SEL_PRODUCT_DIV_ID)
     if elem and elem.get("id"):
         product_id = elem["id"]
         # Extract numeric ID from "product-1481"
-        match = re.search(r"product-(\d+)", product_id)
+        match = _PRODUCT_DIV_ID_RE.search(product_id)
         if match:
             return match.group(1)
 
     # Fallback 2: Look for product_id in inline scripts
-    scripts = soup.find_all("script")
-    for script in scripts:
-        if script.string:
-            match = re.search(r'"product_id":\s*(\d+)', script.string)
-            if match:
-                return match.group(1)
+    # The string= filter skips scripts without the key during the tree walk
+    for script in soup.find_all("script", string=_has_product_id):
+        match = _PRODUCT_ID_JSON_RE.search(script.string)
+        if match:
+            return match.group(1)
 
     return None
 
@@ -233,25 +311,22 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
 
     Confidence: 0.82
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: WooCommerce SKU span
-    elem = soup.select_one("span.sku")
+    elem = ctx.select_first(_SEL_SKU)
     if elem:
         sku = BaseExtractor.clean_text(elem.get_text())
         if sku and sku.lower() != "n/a":
             return sku
 
-    # Fallback 1: Add-to-cart button SKU attribute
-    elem = soup.select_one("button[data-product_sku]")
-    if elem and elem.get("data-product_sku"):
-        return elem["data-product_sku"]
-
-    # Also check anchor tags
-    elem = soup.select_one("a[data-product_sku]")
-    if elem and elem.get("data-product_sku"):
-        return elem["data-product_sku"]
+    # Fallback 1: Add-to-cart button SKU attribute, then anchor tags
+    sku = _button_or_link_attr(soup, _SEL_PRODUCT_SKU, "data-product_sku")
+    if sku:
+        return sku
 
     # Fallback 2: Schema.org SKU meta
-    meta = soup.select_one('meta[itemprop="sku"]')
+    meta = ctx.select_first(_SEL_META_SKU)
     if meta and meta.get("content"):
         sku = meta["content"]
         if sku and sku.lower() != "n/a":
@@ -5,15 +5,14 @@ Converted from JSON pattern on 2025-12-21
 Original confidence: 0.78
 """
 
-import json
 import re
 from decimal import Decimal
 from html import unescape
 from typing import Optional, Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -35,9 +34,19 @@ PATTERN_METADATA = {
     "notes": "FINN recommerce items via advertising JSON with meta fallbacks",
 }
 
+# Everything read below lives in <head> or the advertising-state script
+STRAINER = SoupStrainer(["script", "meta", "link", "title"])
+
+# One pass for both states; the first keyword in the text decides
+_STATUS_RE = re.compile(
+    r"\b(?:(?P<reserved>reservert|reservasjon)|(?P<sold>solgt|utsolgt))\b",
+    re.IGNORECASE,
+)
+_ITEM_ID_RE = re.compile(r"/item/(\d+)")
+
 
 def _load_advertising_state(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
-    script = soup.select_one("script#advertising-initial-state")
+    script = soup.find("script", id="advertising-initial-state")
     if not script:
         return None
     raw = script.string or script.get_text()
@@ -45,19 +54,34 @@ def _load_advertising_state(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
         return None
     raw = raw.strip()
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError:
+        return BaseExtractor.load_json(raw)
+    except ValueError:
         try:
-            return json.loads(unescape(raw))
-        except json.JSONDecodeError:
+            return BaseExtractor.load_json(unescape(raw))
+        except ValueError:
             return None
 
 
+def _get_advertising_state(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
+    """Advertising state JSON, selected and parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_advertising_state)
+
+
 def _get_targeting_entries(state: dict[str, Any]) -> list[Any]:
     targeting = BaseExtractor.extract_json_field(state, "config.adServer.gam.targeting")
     return targeting if isinstance(targeting, list) else []
 
 
+def _load_targeting(soup: BeautifulSoup) -> list[Any]:
+    state = _get_advertising_state(soup)
+    return _get_targeting_entries(state) if state else []
+
+
+def _get_targeting(soup: BeautifulSoup) -> list[Any]:
+    """GAM targeting entries, resolved once per soup for all extractors."""
+    return SelectorCache.for_soup(soup).memo(_load_targeting)
+
+
 def _get_targeting_value(
     targeting: list[Any],
     keys: list[str],
@@ -95,10 +119,9 @@ def _extract_availability_from_text(text: Optional[str]) -> Optional[str]:
     text = BaseExtractor.clean_text(text)
     if not text:
         return None
-    if re.search(r"\b(reservert|reservasjon)\b", text, re.IGNORECASE):
-        return "Reserved"
-    if re.search(r"\b(solgt|utsolgt)\b", text, re.IGNORECASE):
-        return "Sold"
+    match = _STATUS_RE.search(text)
+    if match:
+        return "Reserved" if match.lastgroup == "reserved" else "Sold"
     return "Available"
 
 
@@ -109,18 +132,17 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Primary: advertising JSON targeting
     Confidence: 0.85
     """
-    state = _load_advertising_state(soup)
-    if state:
-        targeting = _get_targeting_entries(state)
+    targeting = _get_targeting(soup)
+    if targeting:
         value = _get_targeting_value(targeting, ["price", "pris", "amount"], index=2)
         if value:
             return BaseExtractor.clean_price(value)
 
-    elem = soup.select_one("meta[property='og:price:amount']")
+    elem = SelectorCache.for_soup(soup).meta("og:price:amount")
     if elem and elem.get("content"):
         return BaseExtractor.clean_price(elem.get("content"))
 
-    elem = soup.select_one("meta[property='product:price:amount']")
+    elem = SelectorCache.for_soup(soup).meta("product:price:amount")
     if elem and elem.get("content"):
         return BaseExtractor.clean_price(elem.get("content"))
 
@@ -134,11 +156,11 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Primary: Open Graph title meta tag
     Confidence: 0.95
     """
-    elem = soup.select_one("meta[property='og:title']")
+    elem = SelectorCache.for_soup(soup).meta("og:title")
     if elem and elem.get("content"):
         return BaseExtractor.clean_text(elem.get("content"))
 
-    elem = soup.select_one("title")
+    elem = soup.find("title")
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -152,15 +174,14 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Primary: Open Graph image
     Confidence: 0.95
     """
-    elem = soup.select_one("meta[property='og:image']")
+    elem = SelectorCache.for_soup(soup).meta("og:image")
     if elem and elem.get("content"):
         value = str(elem.get("content")).strip()
         if value.startswith("http"):
             return value
 
-    state = _load_advertising_state(soup)
-    if state:
-        targeting = _get_targeting_entries(state)
+    targeting = _get_targeting(soup)
+    if targeting:
         value = _get_targeting_value(targeting, ["image", "img", "images"], index=4)
         if value:
             value = str(value).strip()
@@ -179,13 +200,13 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Primary: availability indicator in title/description
     Confidence: 0.60
     """
-    elem = soup.select_one("meta[property='og:title']")
+    elem = SelectorCache.for_soup(soup).meta("og:title")
     if elem and elem.get("content"):
         value = _extract_availability_from_text(elem.get("content"))
         if value:
             return value
 
-    elem = soup.select_one("meta[name='description']")
+    elem = SelectorCache.for_soup(soup).meta("description", "name")
     if elem and elem.get("content"):
         value = _extract_availability_from_text(elem.get("content"))
         if value:
@@ -201,9 +222,8 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Primary: advertising JSON targeting
     Confidence: 0.85
     """
-    state = _load_advertising_state(soup)
-    if state:
-        targeting = _get_targeting_entries(state)
+    targeting = _get_targeting(soup)
+    if targeting:
         value = _get_targeting_value(
             targeting,
             ["item_id", "itemid", "finn_item_id", "id"],
@@ -212,14 +232,14 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
         if value:
             return value.strip()
 
-    elem = soup.select_one("meta[property='og:url']")
+    elem = SelectorCache.for_soup(soup).meta("og:url")
     url = elem.get("content") if elem else None
     if not url:
-        canonical = soup.select_one("link[rel='canonical']")
+        canonical = soup.find("link", rel="canonical")
         url = canonical.get("href") if canonical else None
 
     if url:
-        match = re.search(r"/item/(\d+)", url)
+        match = _ITEM_ID_RE.search(url)
         if match:
             return match.group(1)
 
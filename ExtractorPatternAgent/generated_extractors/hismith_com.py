@@ -4,11 +4,12 @@ Extractor for hismith.com
 Created on: 2025-12-26
 """
 import re
-import json
+from dataclasses import dataclass
+import soupsieve as sv
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -22,6 +23,136 @@ PATTERN_METADATA = {
     'notes': 'Initial pattern - extracts from JSON-LD structured data with OpenGraph fallbacks'
 }
 
+# btGapTag tracking script fields
+_BTGAP_PRICE_RE = re.compile(r'"price"[:\s]+([0-9.]+)')
+_BTGAP_CURRENCY_RE = re.compile(r'"currency"[:\s]+"([A-Z]{3})"')
+
+# One pass for both verdicts; the first phrase in the text decides
+_STOCK_RE = re.compile(
+    r'(?P<in>in stock|available)|(?P<out>out of stock|unavailable)', re.IGNORECASE
+)
+_QUANTITY_RE = re.compile(r'(\d+\+?|>\d+)')
+
+# Precompiled CSS selector; plain tag lookups (title, canonical) use soup.find()
+_SEL_STOCK = sv.compile('.stock-status, .availability, [itemprop="availability"]')
+
+_JSON_LD_RE = re.compile(
+    r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE
+)
+_JSON_LD_RE_BYTES = re.compile(_JSON_LD_RE.pattern.encode(), re.DOTALL | re.IGNORECASE)
+
+# Canonical URL: /805-product-name.html -> 805
+_CANONICAL_ID_RE = re.compile(r'/(\d+)-[^/]+\.html')
+
+
+@dataclass(slots=True, frozen=True)
+class _ProductLD:
+    """The JSON-LD Product and offers fields the extractors read, looked up once."""
+
+    name: Any = None
+    image: Any = None
+    sku: Any = None
+    mpn: Any = None
+    price: Any = None
+    availability: Any = None
+    currency: Any = None
+    offer_image: Any = None
+    offer_sku: Any = None
+    offer_mpn: Any = None
+
+    @classmethod
+    def from_node(cls, node: Dict[str, Any]) -> "_ProductLD":
+        offers = node.get('offers', {})
+        if not isinstance(offers, dict):
+            offers = {}
+        return cls(
+            name=node.get('name'),
+            image=node.get('image'),
+            sku=node.get('sku'),
+            mpn=node.get('mpn'),
+            price=offers.get('price'),
+            availability=offers.get('availability'),
+            currency=offers.get('priceCurrency'),
+            offer_image=offers.get('image'),
+            offer_sku=offers.get('sku'),
+            offer_mpn=offers.get('mpn'),
+        )
+
+
+def _load_products(soup: BeautifulSoup) -> List[_ProductLD]:
+    """
+    Parse every JSON-LD script once and collect its Product objects.
+
+    Objects nested in an @graph array are included. Order follows the page,
+    so "first Product with the field" lookups behave as before.
+    """
+    raw = SelectorCache.for_soup(soup).raw_html
+    if raw is not None:
+        # Scan the raw page for JSON-LD islands instead of walking the tree
+        pattern = _JSON_LD_RE_BYTES if isinstance(raw, bytes) else _JSON_LD_RE
+        marker = b'"Product"' if isinstance(raw, bytes) else '"Product"'
+        blocks = (match.group(1) for match in pattern.finditer(raw))
+        try:
+            return _collect_products(blocks, marker, strict=True)
+        except ValueError:
+            # Some raw block did not decode; the script nodes hold the same
+            # blocks as decoded by the parser
+            pass
+
+    blocks = (
+        script.string
+        for script in soup.find_all('script', type='application/ld+json')
+    )
+    return _collect_products(blocks, '"Product"', strict=False)
+
+
+def _collect_products(blocks: Iterable, marker, strict: bool) -> List[_ProductLD]:
+    """
+    Collect the Product objects of JSON-LD blocks, in order.
+
+    Undecodable blocks are skipped, or their error is re-raised when strict.
+    """
+    # Breadcrumb/Organization/WebSite blocks are skipped without parsing
+    products = []
+    for block in blocks:
+        if not block or marker not in block:
+            continue
+        try:
+            data = BaseExtractor.load_json(block)
+        except ValueError:
+            if strict:
+                raise
+            continue
+        if not isinstance(data, dict):
+            continue
+        graph = data.get('@graph')
+        nodes = [data] + graph if isinstance(graph, list) else [data]
+        products.extend(
+            _ProductLD.from_node(node) for node in nodes
+            if isinstance(node, dict) and node.get('@type') == 'Product'
+        )
+    return products
+
+
+def _products(soup: BeautifulSoup) -> List[_ProductLD]:
+    """JSON-LD Product objects, parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_products)
+
+
+def _is_btgap(text: Optional[str]) -> bool:
+    """String filter for inline btGapTag tracking scripts."""
+    return bool(text) and 'btGapTag' in text
+
+
+def _load_btgap_scripts(soup: BeautifulSoup) -> List[str]:
+    """Text of the btGapTag scripts; the substring test runs during the walk."""
+    return [script.string for script in soup.find_all('script', string=_is_btgap)]
+
+
+def _btgap_scripts(soup: BeautifulSoup) -> List[str]:
+    """btGapTag script texts, collected at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_btgap_scripts)
+
 
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
@@ -34,34 +165,22 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        price = offers.get('price')
-                        if price:
-                            return BaseExtractor.clean_price(str(price))
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.price:
+            return BaseExtractor.clean_price(str(product.price))
 
     # FALLBACK 1: OpenGraph meta tag
-    elem = soup.select_one('meta[property="product:price:amount"]')
+    elem = SelectorCache.for_soup(soup).meta('product:price:amount')
     if elem:
         value = elem.get('content')
         if value:
             return BaseExtractor.clean_price(value)
 
     # FALLBACK 2: JavaScript btGapTag data
-    scripts = soup.find_all('script')
-    for script in scripts:
-        if script.string and 'btGapTag' in script.string:
-            match = re.search(r'"price"[:\s]+([0-9.]+)', script.string)
-            if match:
-                return BaseExtractor.clean_price(match.group(1))
+    for text in _btgap_scripts(soup):
+        match = _BTGAP_PRICE_RE.search(text)
+        if match:
+            return BaseExtractor.clean_price(match.group(1))
 
     return None
 
@@ -77,21 +196,13 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    name = data.get('name')
-                    if name:
-                        value = BaseExtractor.clean_text(name)
-                        return value if value else None
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.name:
+            value = BaseExtractor.clean_text(product.name)
+            return value if value else None
 
     # FALLBACK 1: OpenGraph meta tag
-    elem = soup.select_one('meta[property="og:title"]')
+    elem = SelectorCache.for_soup(soup).meta('og:title')
     if elem:
         value = elem.get('content')
         if value:
@@ -102,7 +213,7 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
             return value if value else None
 
     # FALLBACK 2: Page title
-    elem = soup.select_one('title')
+    elem = soup.find('title')
     if elem:
         value = BaseExtractor.clean_text(elem.get_text())
         if value and ' - ' in value:
@@ -123,22 +234,15 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data - main image
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    image = data.get('image')
-                    if image and isinstance(image, str):
-                        image = image.strip()
-                        if image.startswith('http'):
-                            return image
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        image = product.image
+        if image and isinstance(image, str):
+            image = image.strip()
+            if image.startswith('http'):
+                return image
 
     # FALLBACK 1: OpenGraph meta tag
-    elem = soup.select_one('meta[property="og:image"]')
+    elem = SelectorCache.for_soup(soup).meta('og:image')
     if elem:
         value = elem.get('content')
         if value:
@@ -147,21 +251,12 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
                 return value
 
     # FALLBACK 2: JSON-LD offers.image array (first item)
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        images = offers.get('image')
-                        if isinstance(images, list) and len(images) > 0:
-                            image = images[0]
-                            if isinstance(image, str) and image.startswith('http'):
-                                return image.strip()
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        images = product.offer_image
+        if isinstance(images, list) and len(images) > 0:
+            image = images[0]
+            if isinstance(image, str) and image.startswith('http'):
+                return image.strip()
 
     return None
 
@@ -176,41 +271,31 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.90
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        availability = offers.get('availability')
-                        if availability:
-                            # Normalize schema.org availability URLs
-                            if 'InStock' in availability:
-                                return 'In Stock'
-                            elif 'OutOfStock' in availability:
-                                return 'Out of Stock'
-                            elif 'PreOrder' in availability:
-                                return 'Pre-Order'
-                            # Return cleaned text if not a schema.org URL
-                            value = BaseExtractor.clean_text(availability)
-                            return value if value else None
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        availability = product.availability
+        if availability:
+            # Normalize schema.org availability URLs
+            if 'InStock' in availability:
+                return 'In Stock'
+            elif 'OutOfStock' in availability:
+                return 'Out of Stock'
+            elif 'PreOrder' in availability:
+                return 'Pre-Order'
+            # Return cleaned text if not a schema.org URL
+            value = BaseExtractor.clean_text(availability)
+            return value if value else None
 
     # FALLBACK: Look for stock status elements
-    elem = soup.select_one('.stock-status, .availability, [itemprop="availability"]')
+    elem = _SEL_STOCK.select_one(soup)
     if elem:
         value = BaseExtractor.clean_text(elem.get_text())
         if value:
             # Normalize common patterns
-            if re.search(r'in stock|available', value, re.IGNORECASE):
-                return 'In Stock'
-            if re.search(r'out of stock|unavailable', value, re.IGNORECASE):
-                return 'Out of Stock'
+            match = _STOCK_RE.search(value)
+            if match:
+                return 'In Stock' if match.lastgroup == 'in' else 'Out of Stock'
             # Extract numeric quantity
-            match = re.search(r'(\d+\+?|>\d+)', value)
+            match = _QUANTITY_RE.search(value)
             if match:
                 return match.group(1)
         return value if value else None
@@ -229,44 +314,26 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data - main sku
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    sku = data.get('sku')
-                    if sku:
-                        value = str(sku).strip()
-                        if value:
-                            return value
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.sku:
+            value = str(product.sku).strip()
+            if value:
+                return value
 
     # FALLBACK 1: JSON-LD offers.sku
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        sku = offers.get('sku')
-                        if sku:
-                            value = str(sku).strip()
-                            if value:
-                                return value
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.offer_sku:
+            value = str(product.offer_sku).strip()
+            if value:
+                return value
 
     # FALLBACK 2: URL extraction from canonical link
-    elem = soup.select_one('link[rel="canonical"]')
+    elem = soup.find('link', rel='canonical')
     if elem:
         url = elem.get('href', '')
         if url:
             # Pattern: /805-product-name.html -> extract 805
-            match = re.search(r'/(\d+)-[^/]+\.html', url)
+            match = _CANONICAL_ID_RE.search(url)
             if match:
                 return match.group(1)
 
@@ -283,36 +350,18 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data - main mpn
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    mpn = data.get('mpn')
-                    if mpn:
-                        value = str(mpn).strip()
-                        if value:
-                            return value
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.mpn:
+            value = str(product.mpn).strip()
+            if value:
+                return value
 
     # FALLBACK: JSON-LD offers.mpn
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        mpn = offers.get('mpn')
-                        if mpn:
-                            value = str(mpn).strip()
-                            if value:
-                                return value
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.offer_mpn:
+            value = str(product.offer_mpn).strip()
+            if value:
+                return value
 
     return None
 
@@ -328,35 +377,23 @@ def extract_currency(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict) and data.get('@type') == 'Product':
-                    offers = data.get('offers', {})
-                    if isinstance(offers, dict):
-                        currency = offers.get('priceCurrency')
-                        if currency:
-                            value = str(currency).strip().upper()
-                            if value:
-                                return value
-            except (json.JSONDecodeError, ValueError):
-                continue
+    for product in _products(soup):
+        if product.currency:
+            value = str(product.currency).strip().upper()
+            if value:
+                return value
 
     # FALLBACK 1: OpenGraph meta tag
-    elem = soup.select_one('meta[property="product:price:currency"]')
+    elem = SelectorCache.for_soup(soup).meta('product:price:currency')
     if elem:
         value = elem.get('content')
         if value:
             return str(value).strip().upper()
 
     # FALLBACK 2: JavaScript btGapTag data
-    scripts = soup.find_all('script')
-    for script in scripts:
-        if script.string and 'btGapTag' in script.string:
-            match = re.search(r'"currency"[:\s]+"([A-Z]{3})"', script.string)
-            if match:
-                return match.group(1).upper()
+    for text in _btgap_scripts(soup):
+        match = _BTGAP_CURRENCY_RE.search(text)
+        if match:
+            return match.group(1).upper()
 
     return None
@@ -5,10 +5,12 @@ Converted from JSON pattern on 2025-12-17T16:02:31.859473
 Original confidence: 0.92
 """
 import re
+import soupsieve as sv
+from html import unescape
 from decimal import Decimal
-from typing import Optional
-from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from typing import Any, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -22,6 +24,142 @@ PATTERN_METADATA = {
     'notes': 'Converted from JSON pattern, enhanced with article_number and model_number extraction'
 }
 
+# Only these elements (with their subtrees) are built by extract_from_html.
+# The product blocks (#cash-price-container, .buy-button, stock status) sit
+# inside divs/spans; scripts carry the dataLayer ids
+STRAINER = SoupStrainer(['meta', 'link', 'script', 'h1', 'div', 'span', 'button', 'form'])
+
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call),
+# answered through SelectorCache.select_first's per-soup tag index
+_SEL_CASH_PRICE = sv.compile("#cash-price-container")
+_SEL_BUY_BUTTON = sv.compile(".buy-button")
+_SEL_PRICE_NOW = sv.compile(".product-price-now")
+_SEL_TITLE = sv.compile("h1.product-main-info__title")
+_SEL_MAIN_IMAGE = sv.compile(".product-main-image img")
+_SEL_STOCK_INSTOCK = sv.compile(".stockstatus-instock")
+_SEL_STOCK_DETAILS = sv.compile(".stockstatus-stock-details")
+_SEL_CANONICAL = sv.compile('link[rel="canonical"]')
+
+# Text patterns, compiled once at import
+_AVAILABILITY_PREFIX_RE = re.compile(r'^Tilgjengelighet:\s*', re.IGNORECASE)
+_QUANTITY_RE = re.compile(r'(\d+\+?|\>\d+)')
+_IN_STOCK_RE = re.compile(r'på lager|in stock|stocked', re.IGNORECASE)
+_OUT_OF_STOCK_RE = re.compile(r'ikke på lager|out of stock', re.IGNORECASE)
+_URL_PRODUCT_ID_RE = re.compile(r'/product/(\d+)/')
+
+# Every dataLayer key either field reads, matched in one pass per script
+_DATALAYER_RE = re.compile(
+    r'"(productId|ecomm_prodid|item_id|item_manufacturer_number)"\s*:\s*"([^"]+)"'
+)
+_DATALAYER_RE_BYTES = re.compile(_DATALAYER_RE.pattern.encode())
+
+# Inline script bodies, for scanning the raw page instead of the tree
+_SCRIPT_RE = re.compile(r'<script\b[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+_SCRIPT_RE_BYTES = re.compile(_SCRIPT_RE.pattern.encode(), re.DOTALL | re.IGNORECASE)
+
+# item_stock_status values in the buy-button JSON
+_STOCK_STATUS = {"Stocked": "In Stock", "OutOfStock": "Out of Stock"}
+
+
+def _clean_title(value: str) -> Optional[str]:
+    """clean_text, minus the category suffix (e.g., " - USB-kabler")."""
+    value = BaseExtractor.clean_text(value)
+    if value and ' - ' in value:
+        value = value.rsplit(' - ', 1)[0].strip()
+    return value if value else None
+
+
+def _load_buy_button_data(soup: BeautifulSoup) -> Optional[Any]:
+    """
+    Parsed data-initobject JSON of the .buy-button element, or None.
+
+    The parser already decodes entities in attribute values, so the value
+    is parsed as-is; a second unescape pass is only tried when that fails
+    (markup that escaped the JSON twice).
+    """
+    elem = SelectorCache.for_soup(soup).select_first(_SEL_BUY_BUTTON)
+    if not elem or not elem.get("data-initobject"):
+        return None
+    data_str = elem.get("data-initobject")
+    try:
+        return BaseExtractor.load_json(data_str)
+    except ValueError:
+        pass
+    if '&' not in data_str:
+        return None
+    try:
+        return BaseExtractor.load_json(unescape(data_str))
+    except ValueError:
+        return None
+
+
+def _get_buy_button_data(soup: BeautifulSoup) -> Optional[Any]:
+    """Buy-button data shared by price, title and availability (parsed once per soup)."""
+    return SelectorCache.for_soup(soup).memo(_load_buy_button_data)
+
+
+def _has_datalayer_push(text: Optional[str]) -> bool:
+    """String filter for inline scripts that push to the dataLayer."""
+    return bool(text) and 'dataLayer.push' in text
+
+
+def _load_datalayer_ids(soup: BeautifulSoup) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Article and model number from the dataLayer.push scripts.
+
+    Both fields read the same scripts, so they are scanned once with one
+    alternation. Script bodies come straight from the raw HTML when
+    extract_from_html stored it, skipping the tree walk. The article number
+    prefers productId, then ecomm_prodid, then item_id within the first
+    script that has any of them.
+    """
+    raw = SelectorCache.for_soup(soup).raw_html
+    if isinstance(raw, bytes):
+        scripts = (match.group(1) for match in _SCRIPT_RE_BYTES.finditer(raw))
+        pattern, marker = _DATALAYER_RE_BYTES, b'dataLayer.push'
+    elif raw is not None:
+        scripts = (match.group(1) for match in _SCRIPT_RE.finditer(raw))
+        pattern, marker = _DATALAYER_RE, 'dataLayer.push'
+    else:
+        # The string= filter skips other scripts during the tree walk
+        scripts = (
+            script.string
+            for script in soup.find_all('script', string=_has_datalayer_push)
+        )
+        pattern, marker = _DATALAYER_RE, 'dataLayer.push'
+
+    article_number = model_number = None
+    for text in scripts:
+        if not text or marker not in text:
+            continue
+
+        found = {}
+        for match in pattern.finditer(text):
+            key, value = match.groups()
+            if isinstance(value, bytes):
+                key, value = key.decode(), value.decode('utf-8', 'replace')
+            found.setdefault(key, value)
+
+        if article_number is None:
+            for key in ('productId', 'ecomm_prodid', 'item_id'):
+                if key in found:
+                    article_number = found[key].strip()
+                    break
+        if model_number is None:
+            value = found.get('item_manufacturer_number', '').strip()
+            if value:
+                model_number = value
+
+        if article_number is not None and model_number is not None:
+            break
+
+    return article_number, model_number
+
+
+def _get_datalayer_ids(soup: BeautifulSoup) -> Tuple[Optional[str], Optional[str]]:
+    """dataLayer ids, scanned at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_datalayer_ids)
+
 
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
@@ -30,33 +168,31 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Primary: Primary price in data attribute
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one("#cash-price-container")
+    elem = ctx.select_first(_SEL_CASH_PRICE)
     if elem:
-        value = elem.get("data-price")
-        if value:
-            return BaseExtractor.clean_price(value)
-        # Fallback to text content
-        return BaseExtractor.clean_price(elem.get_text(strip=True))
+        # data-price attribute, falling back to the text content
+        price = BaseExtractor.clean_price(elem.get("data-price") or elem.get_text(strip=True))
+        if price:
+            return price
 
     # Fallback 1: Price from JSON in data-initobject attribute
-    elem = soup.select_one(".buy-button")
-    if elem and elem.get("data-initobject"):
-        try:
-            import json
-            from html import unescape
-            data_str = unescape(elem.get("data-initobject"))
-            data = json.loads(data_str)
-            value = BaseExtractor.extract_json_field(data, "price")
-            if value:
-                return BaseExtractor.clean_price(str(value))
-        except:
-            pass
+    data = _get_buy_button_data(soup)
+    if data:
+        value = BaseExtractor.extract_json_field(data, "price")
+        if value:
+            price = BaseExtractor.clean_price(str(value))
+            if price:
+                return price
 
     # Fallback 2: Displayed price text
-    elem = soup.select_one(".product-price-now")
+    elem = ctx.select_first(_SEL_PRICE_NOW)
     if elem:
-        return BaseExtractor.clean_price(elem.get_text(strip=True))
+        price = BaseExtractor.clean_price(elem.get_text(strip=True))
+        if price:
+            return price
 
     return None
 
@@ -68,41 +204,26 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Primary: Open Graph title meta tag
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one("meta[property='og:title']")
+    elem = ctx.meta("og:title")
     if elem:
         value = elem.get("content")
         if value:
-            value = BaseExtractor.clean_text(value)
-            # Remove category suffix (e.g., " - USB-kabler")
-            if value and ' - ' in value:
-                value = value.rsplit(' - ', 1)[0].strip()
-            return value if value else None
+            return _clean_title(value)
 
     # Fallback 1: Product title heading
-    elem = soup.select_one("h1.product-main-info__title")
+    elem = ctx.select_first(_SEL_TITLE)
     if elem:
-        value = BaseExtractor.clean_text(elem.get_text())
-        if value and ' - ' in value:
-            value = value.rsplit(' - ', 1)[0].strip()
-        return value if value else None
+        return _clean_title(elem.get_text())
 
     # Fallback 2: Title from buy button JSON data
-    elem = soup.select_one(".buy-button")
-    if elem and elem.get("data-initobject"):
-        try:
-            import json
-            from html import unescape
-            data_str = unescape(elem.get("data-initobject"))
-            data = json.loads(data_str)
-            value = BaseExtractor.extract_json_field(data, "webtext1")
-            if value:
-                value = BaseExtractor.clean_text(str(value))
-                if value and ' - ' in value:
-                    value = value.rsplit(' - ', 1)[0].strip()
-                return value if value else None
-        except:
-            pass
+    data = _get_buy_button_data(soup)
+    if data:
+        value = BaseExtractor.extract_json_field(data, "webtext1")
+        if value:
+            return _clean_title(str(value))
 
     return None
 
@@ -114,8 +235,10 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Primary: Secure product image from Open Graph
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one("meta[property='og:image:secure_url']")
+    elem = ctx.meta("og:image:secure_url")
     if elem:
         value = elem.get("content")
         if value:
@@ -124,7 +247,7 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
                 return value
 
     # Fallback 1: Product image from Open Graph
-    elem = soup.select_one("meta[property='og:image']")
+    elem = ctx.meta("og:image")
     if elem:
         value = elem.get("content")
         if value:
@@ -133,7 +256,7 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
                 return value
 
     # Fallback 2: Main product image element
-    elem = soup.select_one(".product-main-image img")
+    elem = ctx.select_first(_SEL_MAIN_IMAGE)
     if elem:
         value = elem.get("src")
         if value:
@@ -151,59 +274,48 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Primary: Stock status icon title attribute
     Confidence: 0.90
     """
-    import re
-    
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one(".stockstatus-instock")
+    elem = ctx.select_first(_SEL_STOCK_INSTOCK)
     if elem:
         value = elem.get("title")
         if value:
             value = BaseExtractor.clean_text(value)
             # Remove "Tilgjengelighet: " prefix
             if value:
-                value = re.sub(r'^Tilgjengelighet:\s*', '', value, flags=re.IGNORECASE).strip()
+                value = _AVAILABILITY_PREFIX_RE.sub('', value).strip()
             # Extract numeric quantity (e.g., "50+ stk. på lager." -> "50+")
             if value:
-                match = re.search(r'(\d+\+?|\>\d+)', value)
+                match = _QUANTITY_RE.search(value)
                 if match:
                     return match.group(1)
                 # Check for keywords
-                if re.search(r'på lager|in stock|stocked', value, re.IGNORECASE):
+                if _IN_STOCK_RE.search(value):
                     return "In Stock"
-                if re.search(r'ikke på lager|out of stock', value, re.IGNORECASE):
+                if _OUT_OF_STOCK_RE.search(value):
                     return "Out of Stock"
             return value if value else None
 
     # Fallback 1: Stock status text
-    elem = soup.select_one(".stockstatus-stock-details")
+    elem = ctx.select_first(_SEL_STOCK_DETAILS)
     if elem:
         value = BaseExtractor.clean_text(elem.get_text())
         if value:
-            value = re.sub(r'^Tilgjengelighet:\s*', '', value, flags=re.IGNORECASE).strip()
+            value = _AVAILABILITY_PREFIX_RE.sub('', value).strip()
             # Extract numeric quantity
-            match = re.search(r'(\d+\+?|\>\d+)', value)
+            match = _QUANTITY_RE.search(value)
             if match:
                 return match.group(1)
         return value if value else None
 
     # Fallback 2: Stock status from JSON data (values: Stocked, OutOfStock)
-    elem = soup.select_one(".buy-button")
-    if elem and elem.get("data-initobject"):
-        try:
-            import json
-            from html import unescape
-            data_str = unescape(elem.get("data-initobject"))
-            data = json.loads(data_str)
-            value = BaseExtractor.extract_json_field(data, "item_stock_status")
-            if value:
-                value = str(value).strip()
-                if value == "Stocked":
-                    return "In Stock"
-                elif value == "OutOfStock":
-                    return "Out of Stock"
-                return BaseExtractor.clean_text(value)
-        except:
-            pass
+    data = _get_buy_button_data(soup)
+    if data:
+        value = BaseExtractor.extract_json_field(data, "item_stock_status")
+        if value:
+            value = str(value).strip()
+            return _STOCK_STATUS.get(value) or BaseExtractor.clean_text(value)
 
     return None
 
@@ -215,31 +327,19 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Primary: Extract from dataLayer.ecomm_prodid or item_id
     Confidence: 0.95
     """
-    import re
-    
-    # Look for dataLayer.push with productId
-    scripts = soup.find_all('script')
-    for script in scripts:
-        if script.string and 'dataLayer.push' in script.string:
-            # Extract the productId field
-            match = re.search(r'"productId"\s*:\s*"([^"]+)"', script.string)
-            if match:
-                return match.group(1).strip()
-            # Also try ecomm_prodid
-            match = re.search(r'"ecomm_prodid"\s*:\s*"([^"]+)"', script.string)
-            if match:
-                return match.group(1).strip()
-            # Also try item_id from ecommerce object
-            match = re.search(r'"item_id"\s*:\s*"([^"]+)"', script.string)
-            if match:
-                return match.group(1).strip()
+    ctx = SelectorCache.for_soup(soup)
+
+    # Look for dataLayer.push with productId (or ecomm_prodid / item_id)
+    article_number, _ = _get_datalayer_ids(soup)
+    if article_number is not None:
+        return article_number
     
     # Fallback: extract from URL (product ID is in the URL)
-    canonical = soup.select_one('link[rel="canonical"]')
+    canonical = ctx.select_first(_SEL_CANONICAL)
     if canonical:
         url = canonical.get('href', '')
         if url:
-            match = re.search(r'/product/(\d+)/', url)
+            match = _URL_PRODUCT_ID_RE.search(url)
             if match:
                 return match.group(1).strip()
     
@@ -253,20 +353,9 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     Primary: Extract from dataLayer.item_manufacturer_number
     Confidence: 0.90
     """
-    import re
-    
     # Look for item_manufacturer_number in dataLayer
-    scripts = soup.find_all('script')
-    for script in scripts:
-        if script.string and 'dataLayer.push' in script.string:
-            # Extract the item_manufacturer_number field
-            match = re.search(r'"item_manufacturer_number"\s*:\s*"([^"]+)"', script.string)
-            if match:
-                value = match.group(1).strip()
-                if value:
-                    return value
-    
-    return None
+    _, model_number = _get_datalayer_ids(soup)
+    return model_number
 
 def extract_currency(soup: BeautifulSoup) -> Optional[str]:
     """
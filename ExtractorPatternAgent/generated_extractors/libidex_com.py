@@ -4,12 +4,12 @@ Auto-generated extractor for libidex.com
 Generated on 2025-12-22
 Confidence: 0.95 (JSON-LD structured data available)
 """
-import json
 import re
+import soupsieve as sv
 from decimal import Decimal
-from typing import Optional
-from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from typing import Any, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -23,27 +23,91 @@ PATTERN_METADATA = {
     'notes': 'Uses JSON-LD structured data as primary extraction method with meta tag fallbacks'
 }
 
+# Only these elements (with their subtrees) are built by extract_from_html:
+# JSON-LD scripts, meta fallbacks and the Magento product blocks
+STRAINER = SoupStrainer(['script', 'meta', 'h1', 'div', 'span', 'form'])
 
-def _get_json_ld_product(soup: BeautifulSoup) -> Optional[dict]:
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call)
+_SEL_FINAL_PRICE = sv.compile("span[data-price-amount][data-price-type='finalPrice']")
+_SEL_PRICE_TEXT = sv.compile(".price-box .price-wrapper .price")
+_SEL_PAGE_TITLE = sv.compile("h1.page-title")
+_SEL_H1 = sv.compile("h1")
+_SEL_GALLERY_IMAGE = sv.compile(".product.media img.gallery-placeholder__image")
+_SEL_PRODUCT_IMAGE = sv.compile(".product-image-container img")
+_SEL_STOCK = sv.compile(".stock.available, .product-info-stock-sku .stock")
+_SEL_FORM_SKU = sv.compile("form[data-product-sku]")
+_SEL_SKU = sv.compile(".product.attribute.sku .value")
+_SEL_PRICE_BOX_META = sv.compile(".price-box meta[content]")
+
+# Product keys the extractors read; the rest (reviews, breadcrumbs...) is dropped
+_PRODUCT_FIELDS = ('name', 'image', 'sku', 'mpn', 'model', 'offers')
+
+# schema.org availability tokens (last URL path component) -> readable text,
+# in the order the substring fallback tries them
+_SCHEMA_AVAILABILITY = {
+    'InStock': 'In Stock',
+    'OutOfStock': 'Out of Stock',
+    'PreOrder': 'Pre-Order',
+    'LimitedAvailability': 'Limited Stock',
+}
+
+# Three-letter currency code in a <meta content> value
+_CURRENCY_CODE_RE = re.compile(r'^[A-Z]{3}$')
+
+
+def _load_json_ld_product(soup: BeautifulSoup) -> Optional[dict]:
     """
     Extract JSON-LD Product structured data.
     
+    Only the keys in _PRODUCT_FIELDS are kept, so large review arrays are
+    released right after parsing.
+
     Returns:
         Product JSON-LD object or None
     """
     scripts = soup.find_all('script', {'type': 'application/ld+json'})
     for script in scripts:
-        if not script.string:
+        text = script.string
+        # Breadcrumb/Organization/WebSite blocks are skipped without parsing
+        if not text or '"Product"' not in text:
             continue
         try:
-            data = json.loads(script.string)
+            data = BaseExtractor.load_json(text)
             if isinstance(data, dict) and data.get('@type') == 'Product':
-                return data
-        except (json.JSONDecodeError, ValueError):
+                return {key: data[key] for key in _PRODUCT_FIELDS if key in data}
+        except ValueError:
             continue
     return None
 
 
+def _get_json_ld_product(soup: BeautifulSoup) -> Optional[dict]:
+    """JSON-LD Product, parsed at most once per soup (a miss is cached too)."""
+    return SelectorCache.for_soup(soup).memo(_load_json_ld_product)
+
+
+def _normalize_schema_availability(availability: Any) -> Optional[str]:
+    """Readable text for a schema.org availability value (URL or bare token)."""
+    if isinstance(availability, str):
+        # https://schema.org/InStock -> InStock: one dict lookup
+        status = _SCHEMA_AVAILABILITY.get(availability.rsplit('/', 1)[-1])
+        if status:
+            return status
+    for token, status in _SCHEMA_AVAILABILITY.items():
+        if token in availability:
+            return status
+    return BaseExtractor.clean_text(availability)
+
+
+def _normalize_stock_text(value: str) -> str:
+    """Map free-text stock labels to In Stock / Out of Stock, else keep them."""
+    value_lower = value.lower()
+    if 'in stock' in value_lower or 'available' in value_lower:
+        return 'In Stock'
+    elif 'out of stock' in value_lower or 'unavailable' in value_lower:
+        return 'Out of Stock'
+    return value
+
+
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
     Extract price.
@@ -53,6 +117,8 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Fallback 2: Price container data attribute
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -60,26 +126,34 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
         if isinstance(offers, dict):
             price = offers.get('price')
             if price:
-                return BaseExtractor.clean_price(str(price))
+                price = BaseExtractor.clean_price(str(price))
+                if price:
+                    return price
     
     # Fallback 1: Meta tag
-    elem = soup.select_one("meta[property='product:price:amount']")
+    elem = ctx.meta("product:price:amount")
     if elem:
         value = elem.get('content')
         if value:
-            return BaseExtractor.clean_price(value)
+            price = BaseExtractor.clean_price(value)
+            if price:
+                return price
     
     # Fallback 2: Price container with data attribute
-    elem = soup.select_one("span[data-price-amount][data-price-type='finalPrice']")
+    elem = ctx(_SEL_FINAL_PRICE)
     if elem:
         value = elem.get('data-price-amount')
         if value:
-            return BaseExtractor.clean_price(value)
+            price = BaseExtractor.clean_price(value)
+            if price:
+                return price
     
     # Fallback 3: Price display text
-    elem = soup.select_one(".price-box .price-wrapper .price")
+    elem = ctx(_SEL_PRICE_TEXT)
     if elem:
-        return BaseExtractor.clean_price(elem.get_text())
+        price = BaseExtractor.clean_price(elem.get_text())
+        if price:
+            return price
 
     return None
 
@@ -93,6 +167,8 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Fallback 2: Page title h1
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -101,19 +177,19 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
             return BaseExtractor.clean_text(name)
     
     # Fallback 1: Open Graph meta tag
-    elem = soup.select_one("meta[property='og:title']")
+    elem = ctx.meta("og:title")
     if elem:
         value = elem.get('content')
         if value:
             return BaseExtractor.clean_text(value)
     
     # Fallback 2: Page heading
-    elem = soup.select_one("h1.page-title")
+    elem = ctx(_SEL_PAGE_TITLE)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
     
     # Fallback 3: Any h1
-    elem = soup.select_one("h1")
+    elem = ctx(_SEL_H1)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -129,6 +205,8 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Fallback 2: Main product image
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -139,21 +217,21 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
                 return image_url.strip()
     
     # Fallback 1: Open Graph image
-    elem = soup.select_one("meta[property='og:image']")
+    elem = ctx.meta("og:image")
     if elem:
         value = elem.get('content')
         if value and value.startswith('http'):
             return value.strip()
     
     # Fallback 2: Main product image
-    elem = soup.select_one(".product.media img.gallery-placeholder__image")
+    elem = ctx(_SEL_GALLERY_IMAGE)
     if elem:
         value = elem.get('src')
         if value and value.startswith('http'):
             return value.strip()
     
     # Fallback 3: Any product image
-    elem = soup.select_one(".product-image-container img")
+    elem = ctx(_SEL_PRODUCT_IMAGE)
     if elem:
         value = elem.get('src')
         if value and value.startswith('http'):
@@ -171,6 +249,8 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Fallback 2: Stock status element
     Confidence: 0.90
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -179,42 +259,24 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
             availability = offers.get('availability')
             if availability:
                 # Convert schema.org URL to readable text
-                if 'InStock' in availability:
-                    return 'In Stock'
-                elif 'OutOfStock' in availability:
-                    return 'Out of Stock'
-                elif 'PreOrder' in availability:
-                    return 'Pre-Order'
-                elif 'LimitedAvailability' in availability:
-                    return 'Limited Stock'
-                return BaseExtractor.clean_text(availability)
+                return _normalize_schema_availability(availability)
     
     # Fallback 1: Meta tag
-    elem = soup.select_one("meta[property='product:availability']")
+    elem = ctx.meta("product:availability")
     if elem:
         value = elem.get('content')
         if value:
             value = BaseExtractor.clean_text(value)
             if value:
                 # Normalize common values
-                value_lower = value.lower()
-                if 'in stock' in value_lower or 'available' in value_lower:
-                    return 'In Stock'
-                elif 'out of stock' in value_lower or 'unavailable' in value_lower:
-                    return 'Out of Stock'
-                return value
+                return _normalize_stock_text(value)
     
     # Fallback 2: Stock status element
-    elem = soup.select_one(".stock.available, .product-info-stock-sku .stock")
+    elem = ctx(_SEL_STOCK)
     if elem:
         value = BaseExtractor.clean_text(elem.get_text())
         if value:
-            value_lower = value.lower()
-            if 'in stock' in value_lower or 'available' in value_lower:
-                return 'In Stock'
-            elif 'out of stock' in value_lower or 'unavailable' in value_lower:
-                return 'Out of Stock'
-            return value
+            return _normalize_stock_text(value)
 
     return None
 
@@ -228,6 +290,8 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Fallback 2: SKU display element
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -243,14 +307,14 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
                 return BaseExtractor.clean_text(str(sku))
     
     # Fallback 1: Form data attribute
-    elem = soup.select_one("form[data-product-sku]")
+    elem = ctx(_SEL_FORM_SKU)
     if elem:
         value = elem.get('data-product-sku')
         if value:
             return BaseExtractor.clean_text(value)
     
     # Fallback 2: SKU display element
-    elem = soup.select_one(".product.attribute.sku .value")
+    elem = ctx(_SEL_SKU)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -293,6 +357,8 @@ def extract_currency(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: JSON-LD structured data
     json_ld = _get_json_ld_product(soup)
     if json_ld:
@@ -303,19 +369,19 @@ def extract_currency(soup: BeautifulSoup) -> Optional[str]:
                 return currency.strip().upper()
     
     # Fallback 1: Meta tag
-    elem = soup.select_one("meta[property='product:price:currency']")
+    elem = ctx.meta("product:price:currency")
     if elem:
         value = elem.get('content')
         if value:
             return value.strip().upper()
     
     # Fallback 2: Price container meta
-    elem = soup.select_one(".price-box meta[content]")
+    elem = ctx(_SEL_PRICE_BOX_META)
     if elem:
         # Look for currency meta near price
         parent = elem.parent
         if parent:
-            currency_meta = parent.find('meta', attrs={'content': re.compile(r'^[A-Z]{3}$')})
+            currency_meta = parent.find('meta', attrs={'content': _CURRENCY_CODE_RE})
             if currency_meta:
                 value = currency_meta.get('content')
                 if value:
@@ -5,14 +5,14 @@ Converted from JSON-LD pattern on 2025-12-20T22:03:02+01:00
 Original confidence: 0.95
 """
 
-import json
 import re
+import soupsieve as sv
 from decimal import Decimal
-from typing import Optional, Any
+from typing import Iterable, Optional, Any, Union
 
 from bs4 import BeautifulSoup
 
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -34,24 +34,71 @@ PATTERN_METADATA = {
     "notes": "JSON-LD Product offers with Open Graph fallbacks",
 }
 
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call)
+_SEL_JSON_LD = sv.compile("script[type='application/ld+json']")
+_SEL_H1 = sv.compile("h1")
+_SEL_AVAILABILITY = sv.compile("[data-availability]")
+_SEL_INTERNAL_PATH = sv.compile("body[data-internal-path]")
 
-def _find_product_json_ld(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
-    scripts = soup.select("script[type='application/ld+json']")
-    for script in scripts:
-        if not script.string:
+_INTERNAL_PATH_ID_RE = re.compile(r"product/(\d+)")
+
+# Product keys the extractors read; the rest (reviews, breadcrumbs...) is dropped
+_PRODUCT_FIELDS = ("name", "image", "sku", "mpn", "offers")
+
+# schema.org availability URL suffixes -> readable text
+_SCHEMA_AVAILABILITY = {"InStock": "In Stock", "OutOfStock": "Out of Stock"}
+
+# JSON-LD islands in the raw page (str and bytes input)
+_JSON_LD_RE = re.compile(
+    r"<script[^>]+application/ld\+json[^>]*>(.*?)</script>", re.DOTALL | re.IGNORECASE
+)
+_JSON_LD_RE_BYTES = re.compile(_JSON_LD_RE.pattern.encode(), re.DOTALL | re.IGNORECASE)
+
+
+def _load_product_json_ld(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
+    raw = SelectorCache.for_soup(soup).raw_html
+    if raw is not None:
+        # Scan the raw page for JSON-LD islands instead of walking the tree
+        pattern = _JSON_LD_RE_BYTES if isinstance(raw, bytes) else _JSON_LD_RE
+        marker = b'"Product"' if isinstance(raw, bytes) else '"Product"'
+        blocks = (match.group(1) for match in pattern.finditer(raw))
+        try:
+            return _product_from_blocks(blocks, marker, strict=True)
+        except ValueError:
+            # Undecodable bytes (or a mis-sliced block): use the parsed scripts
+            pass
+
+    blocks = (script.string for script in _SEL_JSON_LD.select(soup))
+    return _product_from_blocks(blocks, '"Product"', strict=False)
+
+
+def _product_from_blocks(
+    blocks: Iterable[Any], marker: Union[str, bytes], strict: bool
+) -> Optional[dict[str, Any]]:
+    # Breadcrumb/Organization/WebSite blocks are skipped without parsing;
+    # with strict, a block that fails to decode raises instead of being skipped
+    for block in blocks:
+        if not block or marker not in block:
             continue
         try:
-            data = json.loads(script.string)
-        except json.JSONDecodeError:
+            data = BaseExtractor.load_json(block)
+        except ValueError:
+            if strict:
+                raise
             continue
 
         items = data if isinstance(data, list) else [data]
         for item in items:
             if isinstance(item, dict) and item.get("@type") == "Product":
-                return item
+                return {key: item[key] for key in _PRODUCT_FIELDS if key in item}
     return None
 
 
+def _find_product_json_ld(soup: BeautifulSoup) -> Optional[dict[str, Any]]:
+    """JSON-LD Product, parsed at most once per soup (a miss is cached too)."""
+    return SelectorCache.for_soup(soup).memo(_load_product_json_ld)
+
+
 def _extract_offer_value(product: dict[str, Any], field: str) -> Optional[str]:
     offers = product.get("offers") if product else None
     if isinstance(offers, dict):
@@ -70,17 +117,23 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Primary: JSON-LD Product offers.price
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     product = _find_product_json_ld(soup)
     if product:
         value = _extract_offer_value(product, "price")
         if value:
-            return BaseExtractor.clean_price(value)
+            price = BaseExtractor.clean_price(value)
+            if price:
+                return price
 
-    elem = soup.select_one("meta[property='og:price:amount']")
+    elem = ctx.meta("og:price:amount")
     if elem:
         value = elem.get("content")
         if value:
-            return BaseExtractor.clean_price(value)
+            price = BaseExtractor.clean_price(value)
+            if price:
+                return price
 
     return None
 
@@ -92,19 +145,21 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Primary: JSON-LD Product name
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     product = _find_product_json_ld(soup)
     if product:
         value = product.get("name")
         if value:
             return BaseExtractor.clean_text(str(value))
 
-    elem = soup.select_one("meta[property='og:title']")
+    elem = ctx.meta("og:title")
     if elem:
         value = elem.get("content")
         if value:
             return BaseExtractor.clean_text(value)
 
-    elem = soup.select_one("h1")
+    elem = ctx(_SEL_H1)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -118,6 +173,8 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Primary: JSON-LD Product image
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     product = _find_product_json_ld(soup)
     if product:
         value = product.get("image")
@@ -128,7 +185,7 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
             if value.startswith("http"):
                 return value
 
-    elem = soup.select_one("meta[property='og:image']")
+    elem = ctx.meta("og:image")
     if elem:
         value = elem.get("content")
         if value:
@@ -146,19 +203,21 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Primary: JSON-LD Product offers.availability
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     product = _find_product_json_ld(soup)
     if product:
         value = _extract_offer_value(product, "availability")
         if value:
             value = BaseExtractor.clean_text(value)
             if value:
-                if value.endswith("/InStock"):
-                    return "In Stock"
-                if value.endswith("/OutOfStock"):
-                    return "Out of Stock"
+                # https://schema.org/InStock -> InStock: one dict lookup
+                _, slash, token = value.rpartition("/")
+                if slash and token in _SCHEMA_AVAILABILITY:
+                    return _SCHEMA_AVAILABILITY[token]
                 return value
 
-    elem = soup.select_one("[data-availability]")
+    elem = ctx(_SEL_AVAILABILITY)
     if elem:
         value = elem.get("data-availability")
         if value:
@@ -174,17 +233,19 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Primary: JSON-LD Product sku
     Confidence: 0.90
     """
+    ctx = SelectorCache.for_soup(soup)
+
     product = _find_product_json_ld(soup)
     if product:
         value = product.get("sku")
         if value is not None:
             return str(value).strip()
 
-    body = soup.select_one("body[data-internal-path]")
+    body = ctx(_SEL_INTERNAL_PATH)
     if body:
         value = body.get("data-internal-path")
         if value:
-            match = re.search(r"product/(\d+)", value)
+            match = _INTERNAL_PATH_ID_RE.search(value)
             if match:
                 return match.group(1)
 
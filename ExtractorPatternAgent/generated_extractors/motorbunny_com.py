@@ -4,14 +4,14 @@ Auto-generated extractor for motorbunny.com
 Generated on 2025-12-22 for product extraction.
 """
 
-import json
 import re
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 PATTERN_METADATA = {
@@ -31,27 +31,59 @@ PATTERN_METADATA = {
     "notes": "Shopify store with ShopifyAnalytics.meta JSON and Open Graph meta tags",
 }
 
+# Only these elements (with their subtrees) are built by extract_from_html.
+# Availability scans the raw page it keeps, so the body can be skipped
+STRAINER = SoupStrainer(["script", "meta", "span", "h1"])
 
-def _extract_shopify_meta_product(soup: BeautifulSoup) -> Optional[dict]:
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call),
+# answered through SelectorCache.select_first's per-soup tag index
+_SEL_MONEY_PRICE = sv.compile("span.money[data-price]")
+_SEL_MONEY = sv.compile("span.money")
+_SEL_PRODUCT_TITLE = sv.compile("h1.product-title")
+_SEL_H1 = sv.compile("h1")
+
+# Text patterns, compiled once at import
+_SHOPIFY_META_RE = re.compile(r"var meta = ({.*?});", re.DOTALL)
+_CURRENCY_MARKER = "ShopifyAnalytics.meta.currency"
+_CURRENCY_RE = re.compile(r"ShopifyAnalytics\.meta\.currency\s*=\s*['\"](\w+)['\"]")
+
+# Every schema.org availability token the page may mention, found in one scan
+_SCHEMA_AVAILABILITY_RE = re.compile(r"schema\.org/(InStock|OutOfStock|SoldOut|PreOrder)")
+_SCHEMA_AVAILABILITY_RE_BYTES = re.compile(_SCHEMA_AVAILABILITY_RE.pattern.encode())
+
+
+def _load_script_texts(soup: BeautifulSoup) -> List[str]:
+    """Text of every non-empty inline script, in page order."""
+    return [script.string for script in soup.find_all("script") if script.string]
+
+
+def _script_texts(soup: BeautifulSoup) -> List[str]:
+    """Inline script texts, collected at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_script_texts)
+
+
+def _load_shopify_meta_product(soup: BeautifulSoup) -> Optional[dict]:
     """Extract product data from ShopifyAnalytics.meta JavaScript variable."""
-    scripts = soup.find_all("script")
-    for script in scripts:
-        if not script.string:
-            continue
-        if "ShopifyAnalytics.meta" in script.string and "var meta" in script.string:
+    for text in _script_texts(soup):
+        if "ShopifyAnalytics.meta" in text and "var meta" in text:
             # Extract the JSON using regex
-            match = re.search(r"var meta = ({.*?});", script.string, re.DOTALL)
+            match = _SHOPIFY_META_RE.search(text)
             if match:
                 try:
-                    data = json.loads(match.group(1))
+                    data = BaseExtractor.load_json(match.group(1))
                     product = data.get("product")
                     if isinstance(product, dict):
                         return product
-                except (json.JSONDecodeError, TypeError, ValueError):
+                except ValueError:
                     continue
     return None
 
 
+def _extract_shopify_meta_product(soup: BeautifulSoup) -> Optional[dict]:
+    """ShopifyAnalytics.meta product, parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_shopify_meta_product)
+
+
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
     Extract price.
@@ -60,6 +92,8 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Fallback: span.money[data-price]
     Confidence: 0.90
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: ShopifyAnalytics.meta
     product = _extract_shopify_meta_product(soup)
     if product:
@@ -76,14 +110,14 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
                     pass
 
     # Fallback: span.money with data-price attribute
-    elem = soup.select_one("span.money[data-price]")
+    elem = ctx.select_first(_SEL_MONEY_PRICE)
     if elem:
         price_text = elem.get_text(strip=True)
         if price_text:
             return BaseExtractor.clean_price(price_text)
 
     # Fallback 2: any span.money
-    elem = soup.select_one("span.money")
+    elem = ctx.select_first(_SEL_MONEY)
     if elem:
         price_text = elem.get_text(strip=True)
         if price_text:
@@ -100,20 +134,22 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Fallback: h1.product-title
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: Open Graph meta tag
-    elem = soup.select_one("meta[property='og:title']")
+    elem = ctx.meta("og:title")
     if elem:
         title = elem.get("content")
         if title:
             return BaseExtractor.clean_text(title)
 
     # Fallback: h1 with product-title class
-    elem = soup.select_one("h1.product-title")
+    elem = ctx.select_first(_SEL_PRODUCT_TITLE)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
     # Fallback 2: any h1
-    elem = soup.select_one("h1")
+    elem = ctx.select_first(_SEL_H1)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -128,15 +164,17 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Fallback: og:image
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary: Secure Open Graph image
-    elem = soup.select_one("meta[property='og:image:secure_url']")
+    elem = ctx.meta("og:image:secure_url")
     if elem:
         image_url = elem.get("content")
         if image_url and image_url.startswith("http"):
             return image_url
 
     # Fallback: Regular Open Graph image
-    elem = soup.select_one("meta[property='og:image']")
+    elem = ctx.meta("og:image")
     if elem:
         image_url = elem.get("content")
         if image_url and image_url.startswith("http"):
@@ -152,16 +190,27 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Primary: Search for schema.org availability in page HTML
     Confidence: 0.85
     """
-    # Look for schema.org availability in the page source
-    html_text = str(soup)
-    
-    if "schema.org/InStock" in html_text:
-        return "In Stock"
-    
-    if "schema.org/OutOfStock" in html_text or "schema.org/SoldOut" in html_text:
+    # Look for schema.org availability in the page source; the raw page is
+    # scanned when extract_from_html kept it, instead of re-serializing the tree
+    html = SelectorCache.for_soup(soup).raw_html
+    if html is None:
+        html = str(soup)
+    pattern = _SCHEMA_AVAILABILITY_RE_BYTES if isinstance(html, bytes) else _SCHEMA_AVAILABILITY_RE
+
+    # InStock anywhere on the page wins; the others are ranked after the scan
+    tokens = set()
+    for match in pattern.finditer(html):
+        token = match.group(1)
+        if isinstance(token, bytes):
+            token = token.decode()
+        if token == "InStock":
+            return "In Stock"
+        tokens.add(token)
+
+    if "OutOfStock" in tokens or "SoldOut" in tokens:
         return "Out of Stock"
-    
-    if "schema.org/PreOrder" in html_text:
+
+    if "PreOrder" in tokens:
         return "Preorder"
 
     return None
@@ -208,15 +257,15 @@ def extract_currency(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # Try to extract from ShopifyAnalytics
-    scripts = soup.find_all("script")
-    for script in scripts:
-        if not script.string:
-            continue
-        if "ShopifyAnalytics.meta.currency" in script.string:
-            # Look for the currency assignment
-            match = re.search(r"ShopifyAnalytics\.meta\.currency\s*=\s*['\"](\w+)['\"]", script.string)
+    for text in _script_texts(soup):
+        # Look for the currency assignment; the pattern is anchored at each
+        # marker, so the regex never walks the rest of a large bundle
+        idx = text.find(_CURRENCY_MARKER)
+        while idx >= 0:
+            match = _CURRENCY_RE.match(text, idx)
             if match:
                 return match.group(1)
+            idx = text.find(_CURRENCY_MARKER, idx + 1)
     
     # Fallback: USD is the default currency for motorbunny.com
     return "USD"
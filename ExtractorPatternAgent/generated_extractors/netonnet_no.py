@@ -6,11 +6,11 @@ Original confidence: 0.00
 Updated: 2025-12-17 - Improved extraction using JSON-LD structured data
 """
 import re
-import json
 from decimal import Decimal
-from typing import Optional
+from typing import Any, List, Optional
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -24,6 +24,64 @@ PATTERN_METADATA = {
     'notes': 'Updated to use JSON-LD structured data for better reliability'
 }
 
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call),
+# answered through SelectorCache.select_first's per-soup tag index
+_SEL_NAMED_PRICE = sv.compile('[name$="-price"]')
+_SEL_PRICE = sv.compile(".font-bold.text-h1.text-text-price")
+_SEL_H1 = sv.compile("h1")
+_SEL_STOCK_TEXT = sv.compile(".text-error-dark, .text-info-dark")
+
+# Text patterns, compiled once at import
+_OUT_OF_STOCK_RE = re.compile(r'ikke på lager|out of stock', re.IGNORECASE)
+_IN_STOCK_RE = re.compile(r'på lager|in stock', re.IGNORECASE)
+_QUANTITY_RE = re.compile(r'(\d+)\s*(?:stk|på lager)', re.IGNORECASE)
+_ARTICLE_NUMBER_RE = re.compile(r'Art\.nr:\s*(\S+)')
+_DIGITS_RE = re.compile(r'\d+')
+
+# Schema.org availability URL suffixes -> readable text, in the order the
+# substring fallback checks them
+_SCHEMA_AVAILABILITY = {
+    'InStock': "In Stock",
+    'OutOfStock': "Out of Stock",
+    'BackOrder': "Back Order",
+}
+
+
+def _load_products(soup: BeautifulSoup) -> List[dict]:
+    """
+    Parse the JSON-LD scripts once and collect their Product objects.
+
+    Order follows the page, so "first Product with the field" lookups
+    behave as before.
+    """
+    products = []
+    for script in soup.find_all('script', type='application/ld+json'):
+        if script.string and 'Product' in script.string:
+            try:
+                data = BaseExtractor.load_json(script.string)
+            except ValueError:
+                continue
+            if isinstance(data, dict) and data.get('@type') == 'Product':
+                products.append(data)
+    return products
+
+
+def _products(soup: BeautifulSoup) -> List[dict]:
+    """JSON-LD Product objects, parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_products)
+
+
+def _normalize_schema_availability(availability: Any) -> str:
+    """Readable text for a schema.org availability URL, else its last segment."""
+    if isinstance(availability, str):
+        status = _SCHEMA_AVAILABILITY.get(availability.rsplit('/', 1)[-1])
+        if status:
+            return status
+    for token, status in _SCHEMA_AVAILABILITY.items():
+        if token in availability:
+            return status
+    return availability.split('/')[-1]  # Get last part of URL
+
 
 def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     """
@@ -33,28 +91,24 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     Fallback: CSS selectors
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string and 'Product' in script.string:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'Product' and 'offers' in data:
-                    price_str = data['offers'].get('price')
-                    if price_str:
-                        return BaseExtractor.clean_price(price_str)
-            except (json.JSONDecodeError, KeyError):
-                pass
+    for data in _products(soup):
+        if 'offers' in data:
+            price_str = data['offers'].get('price')
+            if price_str:
+                return BaseExtractor.clean_price(price_str)
     
     # FALLBACK 1: Price element with name attribute
-    elem = soup.select_one('[name$="-price"]')
+    elem = ctx.select_first(_SEL_NAMED_PRICE)
     if elem:
         text = elem.get_text(strip=True)
         if text:
             return BaseExtractor.clean_price(text)
     
     # FALLBACK 2: Generic price selector
-    elem = soup.select_one(".font-bold.text-h1.text-text-price")
+    elem = ctx.select_first(_SEL_PRICE)
     if elem:
         return BaseExtractor.clean_price(elem.get_text(strip=True))
 
@@ -68,15 +122,17 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     Primary: meta[property="og:title"]
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one("meta[property=\"og:title\"]")
+    elem = ctx.meta("og:title")
     if elem:
         value = elem.get("content")
         if value:
             return value
 
     # Fallback 1: h1
-    elem = soup.select_one("h1")
+    elem = ctx.select_first(_SEL_H1)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -90,15 +146,17 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     Primary: meta[property="og:image:secure_url"]
     Confidence: 0.95
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # Primary selector
-    elem = soup.select_one("meta[property=\"og:image:secure_url\"]")
+    elem = ctx.meta("og:image:secure_url")
     if elem:
         value = elem.get("content")
         if value:
             return value
 
     # Fallback 1: meta[property="og:image"]
-    elem = soup.select_one("meta[property=\"og:image\"]")
+    elem = ctx.meta("og:image")
     if elem:
         value = elem.get("content")
         if value:
@@ -115,37 +173,27 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     Fallback: Stock status text
     Confidence: 0.85
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string and 'Product' in script.string:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'Product' and 'offers' in data:
-                    availability = data['offers'].get('availability')
-                    if availability:
-                        # Normalize Schema.org values
-                        if 'InStock' in availability:
-                            return "In Stock"
-                        elif 'OutOfStock' in availability:
-                            return "Out of Stock"
-                        elif 'BackOrder' in availability:
-                            return "Back Order"
-                        return availability.split('/')[-1]  # Get last part of URL
-            except (json.JSONDecodeError, KeyError):
-                pass
+    for data in _products(soup):
+        if 'offers' in data:
+            availability = data['offers'].get('availability')
+            if availability:
+                # Normalize Schema.org values
+                return _normalize_schema_availability(availability)
     
     # FALLBACK: Text-based stock status
-    elem = soup.select_one(".text-error-dark, .text-info-dark")
+    elem = ctx.select_first(_SEL_STOCK_TEXT)
     if elem:
         text = BaseExtractor.clean_text(elem.get_text())
         if text:
             # Normalize Norwegian text
-            if re.search(r'ikke på lager|out of stock', text, re.IGNORECASE):
+            if _OUT_OF_STOCK_RE.search(text):
                 return "Out of Stock"
-            elif re.search(r'på lager|in stock', text, re.IGNORECASE):
+            elif _IN_STOCK_RE.search(text):
                 # Try to extract quantity if present
-                match = re.search(r'(\d+)\s*(?:stk|på lager)', text, re.IGNORECASE)
+                match = _QUANTITY_RE.search(text)
                 if match:
                     return f"{match.group(1)}"
                 return "In Stock"
@@ -163,28 +211,21 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string and 'Product' in script.string:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'Product':
-                    sku = data.get('sku')
-                    if sku:
-                        return str(sku).strip()
-            except (json.JSONDecodeError, KeyError):
-                pass
+    for data in _products(soup):
+        sku = data.get('sku')
+        if sku:
+            return str(sku).strip()
     
     # FALLBACK: Article number from page text
     elem = soup.find(id='product-subheader-articleNumber')
     if elem:
         text = elem.get_text(strip=True)
         # Extract number from "Art.nr: 1027759"
-        match = re.search(r'Art\.nr:\s*(\S+)', text)
+        match = _ARTICLE_NUMBER_RE.search(text)
         if match:
             return match.group(1).strip()
         # If no match, try to extract any number
-        match = re.search(r'\d+', text)
+        match = _DIGITS_RE.search(text)
         if match:
             return match.group(0).strip()
     
@@ -199,22 +240,15 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     Confidence: 0.95
     """
     # PRIMARY: JSON-LD structured data
-    scripts = soup.find_all('script', type='application/ld+json')
-    for script in scripts:
-        if script.string and 'Product' in script.string:
-            try:
-                data = json.loads(script.string)
-                if data.get('@type') == 'Product':
-                    # Try mpn (manufacturer part number) first
-                    mpn = data.get('mpn')
-                    if mpn:
-                        return str(mpn).strip()
-                    # Try identifier as fallback
-                    identifier = data.get('identifier')
-                    if identifier:
-                        return str(identifier).strip()
-            except (json.JSONDecodeError, KeyError):
-                pass
+    for data in _products(soup):
+        # Try mpn (manufacturer part number) first
+        mpn = data.get('mpn')
+        if mpn:
+            return str(mpn).strip()
+        # Try identifier as fallback
+        identifier = data.get('identifier')
+        if identifier:
+            return str(identifier).strip()
     
     return None
 
@@ -8,12 +8,12 @@ NOTE: This is a template extractor created without access to the actual HTML.
 It will need to be refined once sample HTML is available for testing.
 """
 
-import json
 import re
 from decimal import Decimal
 from typing import Optional, Any
+import soupsieve as sv
 from bs4 import BeautifulSoup
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 # Metadata (required for discovery)
@@ -27,20 +27,67 @@ PATTERN_METADATA = {
     'notes': 'Tested and verified with product page. Uses OpenGraph meta tags for title/image, meta price tags and URL extraction for article number. Model number not typically available for beverage products.'
 }
 
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call),
+# answered through SelectorCache.select_first's per-soup tag index; tuples
+# are fallbacks tried in order
+_SEL_JSON_LD = sv.compile("script[type='application/ld+json']")
+_SEL_PRICE_ATTRS = tuple(
+    sv.compile(sel) for sel in ('[data-price]', '[data-product-price]', '[data-test-id*="price"]')
+)
+_SEL_PRICE_CLASSES = tuple(
+    sv.compile(sel) for sel in ('.price', '.product-price', '.current-price', '[itemprop="price"]')
+)
+_SEL_ITEMPROP_NAME = sv.compile('[itemprop="name"]')
+_SEL_H1 = sv.compile('h1')
+_SEL_ITEMPROP_IMAGE = sv.compile('[itemprop="image"]')
+_SEL_PRODUCT_IMAGES = tuple(
+    sv.compile(sel) for sel in ('.product-image img', '.product-img img', '[data-test-id*="product-image"]')
+)
+_SEL_AVAILABILITY_LINK = sv.compile('link[itemprop="availability"]')
+_SEL_STOCK = tuple(
+    sv.compile(sel)
+    for sel in ('.stock-status', '.availability', '[data-test-id*="stock"]', '[data-availability]')
+)
+_SEL_SKU = tuple(
+    sv.compile(sel)
+    for sel in ('[itemprop="sku"]', '[itemprop="productID"]', '[data-product-id]', '[data-sku]')
+)
+_SEL_CANONICAL = sv.compile('link[rel="canonical"]')
+_SEL_ITEMPROP_MPN = sv.compile('[itemprop="mpn"]')
 
-def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
+# Text patterns, compiled once at import
+_QUANTITY_RE = re.compile(r'(\d+\+?|\>\d+)')
+_IN_STOCK_RE = re.compile(r'på lager|in stock|available|i lager|tilgjengelig', re.IGNORECASE)
+_OUT_OF_STOCK_RE = re.compile(r'ikke på lager|out of stock|unavailable|utsolgt', re.IGNORECASE)
+_URL_PRODUCT_ID_RE = re.compile(r'/products/(\d+)[-/]')
+_PRODUCT_ID_RE = re.compile(r'"productId"\s*:\s*"?(\w+)"?')
+_MANUFACTURER_NUMBER_RE = re.compile(r'"manufacturer[_\s]?number"\s*:\s*"([^"]+)"', re.IGNORECASE)
+
+# schema.org availability tokens -> readable text; dict order is the
+# priority of the substring fallback for values that are not plain URLs
+_SCHEMA_AVAILABILITY = {
+    'InStock': 'In Stock',
+    'OutOfStock': 'Out of Stock',
+    'SoldOut': 'Out of Stock',
+    'PreOrder': 'Preorder',
+    'LimitedAvailability': 'Limited',
+}
+
+
+def _load_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
     """
     Extract JSON-LD Product structured data.
     
     Many e-commerce sites use schema.org Product markup for SEO.
     """
-    scripts = soup.select("script[type='application/ld+json']")
+    scripts = _SEL_JSON_LD.select(soup)
     for script in scripts:
-        if not script.string:
+        # Breadcrumb/Organization/WebSite blocks are skipped without parsing
+        if not script.string or '"Product"' not in script.string:
             continue
         try:
-            data = json.loads(script.string)
-        except (json.JSONDecodeError, TypeError, ValueError):
+            data = BaseExtractor.load_json(script.string)
+        except ValueError:
             continue
         
         # Handle direct Product object
@@ -64,6 +111,24 @@ def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
     return None
 
 
+def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
+    """JSON-LD Product, selected and parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_product_json_ld)
+
+
+def _normalize_schema_availability(availability: Any) -> Optional[str]:
+    """Readable text for a schema.org availability value (URL or bare token)."""
+    text = str(availability)
+    # https://schema.org/InStock -> InStock: one dict lookup
+    status = _SCHEMA_AVAILABILITY.get(text.rsplit('/', 1)[-1])
+    if status:
+        return status
+    for token, status in _SCHEMA_AVAILABILITY.items():
+        if token in text:
+            return status
+    return BaseExtractor.clean_text(text)
+
+
 def _extract_offer(product: dict) -> Optional[dict]:
     """Extract the offer object from a Product JSON-LD."""
     offers = product.get("offers")
@@ -90,6 +155,8 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     
     Confidence: 0.70 (needs testing)
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD structured data
     product = _extract_product_json_ld(soup)
     if product:
@@ -100,7 +167,7 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
     
     # FALLBACK 1: Meta tags
     for meta_property in ['og:price:amount', 'product:price:amount']:
-        elem = soup.select_one(f"meta[property='{meta_property}']")
+        elem = ctx.meta(meta_property)
         if elem:
             value = elem.get("content")
             if value:
@@ -109,8 +176,8 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
                     return price
     
     # FALLBACK 2: Data attributes
-    for selector in ['[data-price]', '[data-product-price]', '[data-test-id*="price"]']:
-        elem = soup.select_one(selector)
+    for selector in _SEL_PRICE_ATTRS:
+        elem = ctx.select_first(selector)
         if elem:
             value = elem.get("data-price") or elem.get("data-product-price")
             if value:
@@ -123,8 +190,8 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
                 return price
     
     # FALLBACK 3: Common CSS selectors
-    for selector in ['.price', '.product-price', '.current-price', '[itemprop="price"]']:
-        elem = soup.select_one(selector)
+    for selector in _SEL_PRICE_CLASSES:
+        elem = ctx.select_first(selector)
         if elem:
             # Check for price in content attribute
             if elem.get("content"):
@@ -151,6 +218,8 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.80
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD
     product = _extract_product_json_ld(soup)
     if product and product.get("name"):
@@ -162,7 +231,7 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
             return title
     
     # FALLBACK 1: OpenGraph title
-    elem = soup.select_one("meta[property='og:title']")
+    elem = ctx.meta('og:title')
     if elem:
         value = elem.get("content")
         if value:
@@ -176,14 +245,14 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
                 return title
     
     # FALLBACK 2: Product name in itemprop
-    elem = soup.select_one('[itemprop="name"]')
+    elem = ctx.select_first(_SEL_ITEMPROP_NAME)
     if elem:
         title = BaseExtractor.clean_text(elem.get_text())
         if title:
             return title
     
     # FALLBACK 3: H1 heading
-    elem = soup.select_one('h1')
+    elem = ctx.select_first(_SEL_H1)
     if elem:
         title = BaseExtractor.clean_text(elem.get_text())
         if title and len(title) > 3:  # Sanity check
@@ -203,6 +272,8 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.85
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD
     product = _extract_product_json_ld(soup)
     if product:
@@ -225,21 +296,21 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
                     return url
     
     # FALLBACK 1: OpenGraph secure image
-    elem = soup.select_one("meta[property='og:image:secure_url']")
+    elem = ctx.meta('og:image:secure_url')
     if elem:
         value = elem.get("content")
         if value and value.startswith('http'):
             return value
     
     # FALLBACK 2: OpenGraph image
-    elem = soup.select_one("meta[property='og:image']")
+    elem = ctx.meta('og:image')
     if elem:
         value = elem.get("content")
         if value and value.startswith('http'):
             return value
     
     # FALLBACK 3: Product image with itemprop
-    elem = soup.select_one('[itemprop="image"]')
+    elem = ctx.select_first(_SEL_ITEMPROP_IMAGE)
     if elem:
         # Try src attribute
         value = elem.get("src") or elem.get("content")
@@ -247,8 +318,8 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
             return value
     
     # FALLBACK 4: Common product image selectors
-    for selector in ['.product-image img', '.product-img img', '[data-test-id*="product-image"]']:
-        elem = soup.select_one(selector)
+    for selector in _SEL_PRODUCT_IMAGES:
+        elem = ctx.select_first(selector)
         if elem:
             value = elem.get("src") or elem.get("data-src")
             if value and value.startswith('http'):
@@ -268,26 +339,18 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.75
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD
     product = _extract_product_json_ld(soup)
     if product:
         offer = _extract_offer(product)
         if offer and offer.get("availability"):
-            availability = offer.get("availability")
             # Normalize schema.org values
-            if "InStock" in str(availability):
-                return "In Stock"
-            elif "OutOfStock" in str(availability) or "SoldOut" in str(availability):
-                return "Out of Stock"
-            elif "PreOrder" in str(availability):
-                return "Preorder"
-            elif "LimitedAvailability" in str(availability):
-                return "Limited"
-            else:
-                return BaseExtractor.clean_text(str(availability))
+            return _normalize_schema_availability(offer.get("availability"))
     
     # FALLBACK 1: Link/meta availability
-    elem = soup.select_one('link[itemprop="availability"]')
+    elem = ctx.select_first(_SEL_AVAILABILITY_LINK)
     if elem:
         href = elem.get("href", "")
         if "InStock" in href:
@@ -296,8 +359,8 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
             return "Out of Stock"
     
     # FALLBACK 2: Stock status elements
-    for selector in ['.stock-status', '.availability', '[data-test-id*="stock"]', '[data-availability]']:
-        elem = soup.select_one(selector)
+    for selector in _SEL_STOCK:
+        elem = ctx.select_first(selector)
         if elem:
             # Try data attribute first
             value = elem.get("data-availability")
@@ -307,13 +370,13 @@ def extract_availability(soup: BeautifulSoup) -> Optional[str]:
             if value:
                 value = BaseExtractor.clean_text(value)
                 # Extract quantity if present (e.g., "50+ på lager")
-                match = re.search(r'(\d+\+?|\>\d+)', value)
+                match = _QUANTITY_RE.search(value)
                 if match:
                     return match.group(1)
                 # Normalize keywords
-                if re.search(r'på lager|in stock|available|i lager|tilgjengelig', value, re.IGNORECASE):
+                if _IN_STOCK_RE.search(value):
                     return "In Stock"
-                if re.search(r'ikke på lager|out of stock|unavailable|utsolgt', value, re.IGNORECASE):
+                if _OUT_OF_STOCK_RE.search(value):
                     return "Out of Stock"
                 return value
     
@@ -332,6 +395,8 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.75
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD
     product = _extract_product_json_ld(soup)
     if product:
@@ -341,15 +406,15 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     
     # FALLBACK 1: Meta tags
     for meta_property in ['product:retailer_item_id', 'product:product_id']:
-        elem = soup.select_one(f"meta[property='{meta_property}']")
+        elem = ctx.meta(meta_property)
         if elem:
             value = elem.get("content")
             if value:
                 return str(value).strip()
     
     # FALLBACK 2: Data attributes or itemprop
-    for selector in ['[itemprop="sku"]', '[itemprop="productID"]', '[data-product-id]', '[data-sku]']:
-        elem = soup.select_one(selector)
+    for selector in _SEL_SKU:
+        elem = ctx.select_first(selector)
         if elem:
             value = elem.get("content") or elem.get("data-product-id") or elem.get("data-sku")
             if not value:
@@ -358,12 +423,12 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
                 return str(value).strip()
     
     # FALLBACK 3: Extract from URL (e.g., /products/53036-...)
-    canonical = soup.select_one('link[rel="canonical"]')
+    canonical = ctx.select_first(_SEL_CANONICAL)
     if canonical:
         url = canonical.get('href', '')
         if url:
             # Pattern for /products/{id}-{slug}
-            match = re.search(r'/products/(\d+)[-/]', url)
+            match = _URL_PRODUCT_ID_RE.search(url)
             if match:
                 return match.group(1).strip()
     
@@ -371,7 +436,7 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
     scripts = soup.find_all('script')
     for script in scripts:
         if script.string and 'dataLayer' in script.string:
-            match = re.search(r'"productId"\s*:\s*"?(\w+)"?', script.string)
+            match = _PRODUCT_ID_RE.search(script.string)
             if match:
                 return match.group(1).strip()
     
@@ -389,6 +454,8 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     
     Confidence: 0.70
     """
+    ctx = SelectorCache.for_soup(soup)
+
     # PRIMARY: JSON-LD
     product = _extract_product_json_ld(soup)
     if product:
@@ -397,14 +464,14 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
             return str(mpn).strip()
     
     # FALLBACK 1: Meta tags
-    elem = soup.select_one("meta[property='product:mfr_part_no']")
+    elem = ctx.meta('product:mfr_part_no')
     if elem:
         value = elem.get("content")
         if value:
             return str(value).strip()
     
     # FALLBACK 2: Itemprop
-    elem = soup.select_one('[itemprop="mpn"]')
+    elem = ctx.select_first(_SEL_ITEMPROP_MPN)
     if elem:
         value = elem.get("content")
         if not value:
@@ -416,7 +483,7 @@ def extract_model_number(soup: BeautifulSoup) -> Optional[str]:
     scripts = soup.find_all('script')
     for script in scripts:
         if script.string and 'dataLayer' in script.string:
-            match = re.search(r'"manufacturer[_\s]?number"\s*:\s*"([^"]+)"', script.string, re.IGNORECASE)
+            match = _MANUFACTURER_NUMBER_RE.search(script.string)
             if match:
                 return match.group(1).strip()
     
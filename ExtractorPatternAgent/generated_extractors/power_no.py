@@ -4,13 +4,13 @@ Auto-generated extractor for power.no
 Generated on 2025-12-20 for product extraction.
 """
 
-import json
 from decimal import Decimal
 from typing import Optional, Any
 
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
-from ._base import BaseExtractor
+from ._base import BaseExtractor, SelectorCache
 
 
 PATTERN_METADATA = {
@@ -31,15 +31,32 @@ PATTERN_METADATA = {
     "notes": "JSON-LD Product offers with meta fallbacks",
 }
 
+# Everything read below is JSON-LD, <head> meta or the product heading
+STRAINER = SoupStrainer(["script", "meta", "h1"])
 
-def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
-    scripts = soup.select("script[type='application/ld+json']")
+# Precompiled CSS selectors (skips soupsieve's parse/cache lookup per call)
+_SEL_JSON_LD = sv.compile("script[type='application/ld+json']")
+_SEL_H1 = sv.compile("h1")
+
+# schema.org availability tokens -> readable text, in the order the
+# substring fallback tries them
+_SCHEMA_AVAILABILITY = {
+    "InStock": "In Stock",
+    "OutOfStock": "Out of Stock",
+    "SoldOut": "Out of Stock",
+    "PreOrder": "Preorder",
+}
+
+
+def _load_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
+    scripts = _SEL_JSON_LD.select(soup)
     for script in scripts:
-        if not script.string:
+        # Blocks without a Product (breadcrumbs, organization) are not parsed
+        if not script.string or '"Product"' not in script.string:
             continue
         try:
-            data = json.loads(script.string)
-        except (json.JSONDecodeError, TypeError, ValueError):
+            data = BaseExtractor.load_json(script.string)
+        except ValueError:
             continue
         product = _find_product_node(data)
         if product:
@@ -47,6 +64,11 @@ def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
     return None
 
 
+def _extract_product_json_ld(soup: BeautifulSoup) -> Optional[dict]:
+    """JSON-LD Product, selected and parsed at most once per soup."""
+    return SelectorCache.for_soup(soup).memo(_load_product_json_ld)
+
+
 def _find_product_node(data: Any) -> Optional[dict]:
     if isinstance(data, dict):
         if data.get("@type") == "Product":
@@ -82,12 +104,13 @@ def _normalize_availability(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
     text = str(value).strip()
-    if "InStock" in text:
-        return "In Stock"
-    if "OutOfStock" in text or "SoldOut" in text:
-        return "Out of Stock"
-    if "PreOrder" in text:
-        return "Preorder"
+    # https://schema.org/InStock -> InStock: one dict lookup
+    status = _SCHEMA_AVAILABILITY.get(text.rsplit("/", 1)[-1])
+    if status:
+        return status
+    for token, status in _SCHEMA_AVAILABILITY.items():
+        if token in text:
+            return status
     return BaseExtractor.clean_text(text)
 
 
@@ -121,13 +144,13 @@ def extract_title(soup: BeautifulSoup) -> Optional[str]:
         if value:
             return value
 
-    elem = soup.select_one("meta[property='og:title']")
+    elem = SelectorCache.for_soup(soup).meta("og:title")
     if elem:
         value = BaseExtractor.clean_text(elem.get("content"))
         if value:
             return value
 
-    elem = soup.select_one("h1")
+    elem = SelectorCache.for_soup(soup).select_first(_SEL_H1)
     if elem:
         return BaseExtractor.clean_text(elem.get_text())
 
@@ -149,7 +172,7 @@ def extract_image(soup: BeautifulSoup) -> Optional[str]:
         if isinstance(image, str) and image.startswith("http"):
             return image
 
-    elem = soup.select_one("meta[property='og:image']")
+    elem = SelectorCache.for_soup(soup).meta("og:image")
     if elem:
         value = elem.get("content")
         if value and value.startswith("http"):
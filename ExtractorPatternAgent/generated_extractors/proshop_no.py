@@ -5,6 +5,7 @@ Generated on 2025-12-22
 Strategy: JSON-LD structured data + meta tags fallback
 """
 import json
+import re
 from decimal import Decimal
 from typing import Optional
 from bs4 import BeautifulSoup
@@ -70,7 +71,6 @@ def extract_price(soup: BeautifulSoup) -> Optional[Decimal]:
         content = meta.get('content', '')
         if 'kr' in content:
             # Extract first price-like pattern
-            import re
             match = re.search(r'([\d\s.,]+)\s*kr', content)
             if match:
                 return BaseExtractor.clean_price(match.group(1))
@@ -236,7 +236,6 @@ def extract_article_number(soup: BeautifulSoup) -> Optional[str]:
                     return value
     
     # Fallback 2: Extract from small tag with "Varenummer:"
-    import re
     small_tags = soup.find_all('small')
     for small_tag in small_tags:
         text = small_tag.get_text()
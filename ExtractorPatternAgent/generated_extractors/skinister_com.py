@@ -3,7 +3,6 @@ Extractor for skinister.com
 
 Generated on: 2025-12-26
 """
-import re
 import json
 from decimal import Decimal
 from typing import Optional
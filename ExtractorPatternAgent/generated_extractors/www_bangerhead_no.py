@@ -4,7 +4,6 @@ Auto-generated extractor for www.bangerhead.no
 Generated: 2025-12-27
 Confidence: 0.95
 """
-import json
 import re
 from decimal import Decimal
 from typing import Optional
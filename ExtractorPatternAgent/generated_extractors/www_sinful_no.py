@@ -5,7 +5,6 @@ Generated on 2025-12-22
 Domain: www.sinful.no / sinful.no
 """
 import re
-import json
 from decimal import Decimal
 from typing import Optional
 from bs4 import BeautifulSoup
@@ -71,7 +71,7 @@ async def handle_cookie_dialog(page, quiet: bool = False):
                     # Wait for dialog to disappear
                     await page.wait_for_timeout(1000)
                     return
-        except:
+        except Exception:
             # Selector not found or timeout, try next one
             continue
 
@@ -84,7 +84,7 @@ async def handle_cookie_dialog(page, quiet: bool = False):
                 print("✓ Cookie dialog accepted (role fallback)")
             await page.wait_for_timeout(1000)
             return
-    except:
+    except Exception:
         pass
 
     # Fallback: check iframe-based dialogs
@@ -97,7 +97,7 @@ async def handle_cookie_dialog(page, quiet: bool = False):
                     print("✓ Cookie dialog accepted (iframe role fallback)")
                 await page.wait_for_timeout(1000)
                 return
-        except:
+        except Exception:
             continue
 
 
@@ -59,7 +59,8 @@ class ExtractorTester:
         if not html_file.exists():
             raise FileNotFoundError(f"No HTML file found in sample: {sample_path}")
 
-        html = html_file.read_text(encoding='utf-8')
+        # Raw bytes: lxml detects the page encoding while parsing
+        html = html_file.read_bytes()
 
         # Load metadata
         metadata_file = sample_path / "metadata.json"
@@ -0,0 +1,71 @@
+"""Tests for the aliexpress.com raw-HTML sold-out and currency checks."""
+
+import pytest
+
+from ExtractorPatternAgent.generated_extractors import aliexpress_com
+from ExtractorPatternAgent.generated_extractors._base import BaseExtractor, SelectorCache
+
+
+TITLE = '<h1 data-pl="product-title">Mug</h1>'
+CURRENCY_META = '<meta property="og:price:currency" content="NOK">'
+PRICE_SPAN = '<span class="price-default--current--x1">USD12.50</span>'
+SOLD_OUT_SKU = '<div class="sku-item--selected sku-item--soldOut">Red</div>'
+OTHER_SOLD_OUT_SKU = '<div class="sku-item--soldOut">Blue</div>'
+
+PAGES = {
+    "meta only": CURRENCY_META + TITLE,
+    "span and meta": CURRENCY_META + PRICE_SPAN + TITLE,
+    "span only": PRICE_SPAN + TITLE,
+    "selected sold out": CURRENCY_META + SOLD_OUT_SKU + TITLE,
+    "other sku sold out": CURRENCY_META + OTHER_SOLD_OUT_SKU + TITLE,
+    "lowercase currency": '<meta property="og:price:currency" content="nok">' + TITLE,
+    "empty": "",
+}
+
+
+def _soup(html, raw):
+    """Parse html as extract_from_html does, with raw as the raw page."""
+    soup = BaseExtractor.parse_html(html, aliexpress_com.STRAINER)
+    SelectorCache.for_soup(soup).raw_html = raw
+    return soup
+
+
+@pytest.fixture(params=[str, bytes], ids=["str", "bytes"])
+def as_raw(request):
+    """Feed the checks decoded text and undecoded bytes alike."""
+    if request.param is str:
+        return lambda text: text
+    return lambda text: text.encode("utf-8")
+
+
+class TestRawHtmlChecks:
+    """Test that the raw-HTML checks answer like the soup path."""
+
+    @pytest.mark.parametrize("page", PAGES.values(), ids=PAGES.keys())
+    def test_currency_matches_soup(self, as_raw, page):
+        """Test extract_currency with and without the raw page."""
+        html = f"<html><head></head><body>{page}</body></html>"
+
+        assert aliexpress_com.extract_currency(
+            _soup(html, as_raw(html))
+        ) == aliexpress_com.extract_currency(_soup(html, None))
+
+    @pytest.mark.parametrize("page", PAGES.values(), ids=PAGES.keys())
+    def test_availability_matches_soup(self, as_raw, page):
+        """Test extract_availability with and without the raw page."""
+        html = f"<html><head></head><body>{page}</body></html>"
+
+        assert aliexpress_com.extract_availability(
+            _soup(html, as_raw(html))
+        ) == aliexpress_com.extract_availability(_soup(html, None))
+
+    def test_raw_currency(self, as_raw):
+        """Test that the meta currency is read when no price span is rendered."""
+        assert aliexpress_com._raw_og_currency(as_raw(CURRENCY_META)) == "NOK"
+        assert aliexpress_com._raw_og_currency(as_raw(CURRENCY_META + PRICE_SPAN)) is None
+
+    def test_raw_sold_out(self, as_raw):
+        """Test that pages without the soldOut class skip the tree walk."""
+        assert aliexpress_com._raw_may_be_sold_out(as_raw(TITLE)) is False
+        assert aliexpress_com._raw_may_be_sold_out(as_raw(SOLD_OUT_SKU)) is True
+        assert aliexpress_com._raw_may_be_sold_out(None) is True
@@ -0,0 +1,131 @@
+"""Tests for the aliexpress.com window.runParams scanner."""
+
+import json
+
+import pytest
+
+from ExtractorPatternAgent.generated_extractors.aliexpress_com import (
+    _RUN_PARAMS_MODULES,
+    _parse_run_params,
+)
+
+
+RUN_PARAMS = {
+    "data": {
+        "titleModule": {"subject": "Mug {large} }; window.x = {"},
+        "priceModule": {
+            "minAmount": {"value": 199.5, "currency": "NOK"},
+            "minActivityAmount": {"value": 149, "extra": {"nested": {"deep": [{}]}}},
+        },
+        "otherModule": {"priceModule": {"minAmount": {"value": 1}}},
+        "quantityModule": {"totalAvailQuantity": 3},
+    },
+    "csrfToken": "abc",
+}
+
+
+def _page(run_params: str) -> str:
+    return (
+        "<html><head><script>var a = {x: 1};</script><script>\n"
+        f"window.runParams = {run_params};\nvar GaData = {{}};\n"
+        "</script></head><body></body></html>"
+    )
+
+
+@pytest.fixture(params=[str, bytes], ids=["str", "bytes"])
+def as_raw(request):
+    """Feed the scanner decoded text and undecoded bytes alike."""
+    if request.param is str:
+        return lambda text: text
+    return lambda text: text.encode("utf-8")
+
+
+class TestRunParamsScanner:
+    """Test slicing and parsing the window.runParams data modules."""
+
+    def test_matches_full_parse(self, as_raw):
+        """Test that the wanted modules equal those of a full JSON parse."""
+        data = _parse_run_params(as_raw(_page(json.dumps(RUN_PARAMS))))
+
+        expected = {
+            name: value
+            for name, value in RUN_PARAMS["data"].items()
+            if name in _RUN_PARAMS_MODULES
+        }
+        assert data == expected
+
+    def test_braces_inside_strings(self, as_raw):
+        """Test that braces and semicolons in string values are not structural."""
+        data = _parse_run_params(as_raw(_page(json.dumps(RUN_PARAMS))))
+
+        assert data["titleModule"]["subject"] == "Mug {large} }; window.x = {"
+        assert data["quantityModule"] == {"totalAvailQuantity": 3}
+
+    def test_escaped_quotes(self, as_raw):
+        """Test that escaped quotes do not end a string early."""
+        payload = (
+            '{"data": {"titleModule": {"subject": "12\\" ruler \\\\\\"{\\" \\\\"},'
+            ' "priceModule": {"minAmount": {"value": 5}}}}'
+        )
+
+        data = _parse_run_params(as_raw(_page(payload)))
+
+        assert data["titleModule"]["subject"] == '12" ruler \\"{" \\'
+        assert data["priceModule"] == {"minAmount": {"value": 5}}
+
+    def test_nested_modules(self, as_raw):
+        """Test that only modules directly under "data" are picked up."""
+        payload = json.dumps({
+            "pageModule": {"titleModule": {"subject": "wrong"}},
+            "data": {
+                "otherModule": {"titleModule": {"subject": "also wrong"}},
+                "titleModule": {"subject": "right", "priceModule": {"value": 1}},
+            },
+        })
+
+        data = _parse_run_params(as_raw(_page(payload)))
+
+        assert data == {"titleModule": {"subject": "right", "priceModule": {"value": 1}}}
+
+    def test_duplicate_module_last_wins(self, as_raw):
+        """Test that a repeated module key keeps the last value, as json does."""
+        payload = '{"data": {"titleModule": {"subject": "a"}, "titleModule": {"subject": "b"}}}'
+
+        data = _parse_run_params(as_raw(_page(payload)))
+
+        assert data == json.loads(payload)["data"]
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            _page(json.dumps(RUN_PARAMS))[:-60],
+            _page('{"data": {"titleModule": {"subject": "unterminated}}}'),
+            _page('{"data": {"titleModule": {"subject": "x"}}'),
+        ],
+        ids=["cut-off", "unterminated-string", "missing-close-brace"],
+    )
+    def test_truncated_run_params(self, as_raw, page):
+        """Test that an incomplete runParams object gives None."""
+        assert _parse_run_params(as_raw(page)) is None
+
+    @pytest.mark.parametrize(
+        "page",
+        [
+            "<html><head><script>var a = {};</script></head></html>",
+            _page("JSON.parse('{}')"),
+            _page('{"csrfToken": "abc", "other": {"titleModule": {}}}'),
+            "",
+        ],
+        ids=["no-assignment", "not-an-object", "no-data", "empty"],
+    )
+    def test_missing_run_params(self, as_raw, page):
+        """Test that pages without a runParams data object give None."""
+        assert _parse_run_params(as_raw(page)) is None
+
+    def test_undecodable_module_is_skipped(self, as_raw):
+        """Test that one malformed module does not drop the others."""
+        payload = '{"data": {"titleModule": {"subject": x}, "quantityModule": {"n": 1}}}'
+
+        data = _parse_run_params(as_raw(_page(payload)))
+
+        assert data == {"quantityModule": {"n": 1}}
@@ -0,0 +1,65 @@
+"""Tests for BaseExtractor.clean_text."""
+
+import itertools
+import re
+import sys
+
+import pytest
+
+from ExtractorPatternAgent.generated_extractors._base import BaseExtractor
+
+
+def baseline_clean_text(text):
+    """The original \\s+ implementation clean_text must stay equivalent to."""
+    if not text:
+        return None
+    text = re.sub(r"\s+", " ", str(text).strip())
+    return text if text else None
+
+
+WHITESPACE = [chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace()]
+
+
+class TestCleanText:
+    """Test clean_text against the original \\s+ collapse."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            # tabs and newlines
+            "Kettle\t1.7 L",
+            "Kettle\n1.7 L",
+            "Kettle\r\n1.7 L",
+            "\n\t Kettle \n\t1.7 L\n",
+            # non-breaking and other Unicode spaces
+            "1\xa0990 kr",
+            "Kettle \xa01.7 L",
+            "Kettle  1.7　L",
+            # runs of two or more spaces
+            "Kettle  1.7 L",
+            "Kettle     1.7   L",
+            "  Kettle  ",
+            # already clean
+            "Kettle 1.7 L",
+            "Kettle",
+            "Tørr hud - 50 ml",
+            # empty or whitespace only
+            "",
+            " ",
+            "\t\n\xa0",
+            None,
+        ],
+    )
+    def test_matches_baseline(self, text):
+        """Test representative titles and labels."""
+        assert BaseExtractor.clean_text(text) == baseline_clean_text(text)
+
+    def test_every_whitespace_pair_matches_baseline(self):
+        """Test each pair of Unicode whitespace characters between words."""
+        for first, second in itertools.product(WHITESPACE + [""], WHITESPACE):
+            text = f"a{first}{second}b {first}c"
+            assert BaseExtractor.clean_text(text) == baseline_clean_text(text), repr(text)
+
+    def test_non_str_input(self):
+        """Test that numbers are converted like the original."""
+        assert BaseExtractor.clean_text(12345) == baseline_clean_text(12345) == "12345"
@@ -0,0 +1,75 @@
+"""Tests for BaseExtractor.parse_html."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from ExtractorPatternAgent.generated_extractors import get_parser
+from ExtractorPatternAgent.generated_extractors._base import BaseExtractor
+
+
+PRODUCT_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta property="og:title" content="Solo Super Julebrus - Oda">
+  <meta property="og:image" content="https://img.example/p.jpg">
+  <meta property="og:image:secure_url" content="https://img.example/s.jpg">
+  <meta property="product:price:amount" content="39.90">
+  <link rel="canonical" href="https://oda.com/no/products/53036-solo/">
+  <script type="application/ld+json">
+    {"@context": "https://schema.org", "@type": "BreadcrumbList"}
+  </script>
+  <script type="application/ld+json">
+    {"@type": "Product", "name": "Solo Super", "sku": "53036", "mpn": "SOLO-6",
+     "image": ["https://img.example/ld.jpg"],
+     "offers": {"price": "39.90", "availability": "https://schema.org/InStock"}}
+  </script>
+  <script>var meta = {"product": {"variants": [{"price": 3990, "sku": "MB-1"}]}};
+    ShopifyAnalytics.meta = meta; ShopifyAnalytics.meta.currency = 'USD';</script>
+</head>
+<body>
+  <h1 class="product-title">Solo <span>Super</span> Julebrus</h1>
+  <span class="money" data-price="3990">$39.90</span>
+  <div class="text-info-dark">5 stk på lager</div>
+  <p id="product-subheader-articleNumber">Art.nr: 1027759</p>
+</body>
+</html>"""
+
+FIELDS = [
+    "extract_price",
+    "extract_title",
+    "extract_image",
+    "extract_availability",
+    "extract_article_number",
+    "extract_model_number",
+    "extract_currency",
+]
+
+
+class TestParseHtml:
+    """Test BaseExtractor.parse_html."""
+
+    def test_uses_lxml(self):
+        """Test that pages are parsed with the lxml backend."""
+        soup = BaseExtractor.parse_html(PRODUCT_PAGE)
+
+        assert soup.builder.NAME == "lxml"
+
+    def test_parses_bytes(self):
+        """Test that undecoded bytes give the same tree as str."""
+        from_str = BaseExtractor.parse_html(PRODUCT_PAGE)
+        from_bytes = BaseExtractor.parse_html(PRODUCT_PAGE.encode("utf-8"))
+
+        assert str(from_bytes) == str(from_str)
+
+    @pytest.mark.parametrize(
+        "domain", ["motorbunny.com", "oda.com", "netonnet.no", "power.no"]
+    )
+    def test_selectors_match_html_parser(self, domain):
+        """Test that lxml and html.parser trees give the same fields."""
+        extractor = get_parser(domain)
+        lxml_soup = BaseExtractor.parse_html(PRODUCT_PAGE)
+        builtin_soup = BeautifulSoup(PRODUCT_PAGE, "html.parser")
+
+        for name in FIELDS:
+            method = getattr(extractor, name)
+            assert method(lxml_soup) == method(builtin_soup), name
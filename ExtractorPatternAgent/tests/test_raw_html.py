@@ -0,0 +1,66 @@
+"""Tests for extractors that read JSON-LD from the raw page."""
+
+from decimal import Decimal
+
+import pytest
+
+from ExtractorPatternAgent.generated_extractors import _raw_page, extract_from_html, get_parser
+from ExtractorPatternAgent.generated_extractors._base import BaseExtractor, SelectorCache
+
+
+LATIN1_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="iso-8859-1">
+  <meta property="og:title" content="Krem for tørr hud">
+  <script type="application/ld+json">
+    {"@type": "Product", "name": "Krem for tørr hud", "sku": "123",
+     "offers": {"@type": "Offer", "price": "149.90", "priceCurrency": "NOK",
+                "availability": "https://schema.org/InStock"}}
+  </script>
+</head>
+<body><h1>Krem for tørr hud</h1></body>
+</html>""".encode("iso-8859-1")
+
+RAW_JSON_LD_DOMAINS = ["farmasiet.no", "hismith.com", "med24.no"]
+
+
+class TestRawJsonLdFallback:
+    """Test that raw JSON-LD blocks that fail to decode are read from the tree."""
+
+    @pytest.mark.parametrize("domain", RAW_JSON_LD_DOMAINS)
+    def test_undecodable_raw_block_falls_back_to_tree(self, domain):
+        """Test a Latin-1 page whose raw bytes are not valid UTF-8 JSON."""
+        parser = get_parser(domain)
+        soup = BaseExtractor.parse_html(LATIN1_PAGE, getattr(parser, "STRAINER", None))
+        SelectorCache.for_soup(soup).raw_html = LATIN1_PAGE
+
+        assert parser.extract_price(soup) == Decimal("149.90")
+        assert parser.extract_title(soup) == "Krem for tørr hud"
+
+
+class TestRawPageDecoding:
+    """Test the raw page kept by extract_from_html for non-UTF-8 input."""
+
+    @pytest.mark.parametrize("domain", ["farmasiet.no", "hismith.com", "med24.no"])
+    def test_latin1_bytes_page(self, domain):
+        """Test that undecoded Latin-1 bytes give the same fields as text."""
+        from_bytes = extract_from_html(domain, LATIN1_PAGE)
+        from_text = extract_from_html(domain, LATIN1_PAGE.decode("iso-8859-1"))
+
+        assert from_bytes.price == Decimal("149.90")
+        assert from_bytes.title == "Krem for tørr hud"
+        assert from_bytes.to_dict() == from_text.to_dict()
+
+    def test_utf8_bytes_are_kept(self):
+        """Test that UTF-8 bytes reach the scanners undecoded."""
+        html = LATIN1_PAGE.decode("iso-8859-1").replace("iso-8859-1", "utf-8").encode()
+        soup = BaseExtractor.parse_html(html)
+
+        assert _raw_page(html, soup) is html
+
+    def test_other_charsets_are_decoded(self):
+        """Test that bytes in another charset are decoded with the detected one."""
+        soup = BaseExtractor.parse_html(LATIN1_PAGE)
+
+        assert _raw_page(LATIN1_PAGE, soup) == LATIN1_PAGE.decode("iso-8859-1")
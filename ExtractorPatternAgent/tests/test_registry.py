@@ -0,0 +1,270 @@
+"""Tests for the extractor registry."""
+
+import importlib
+import json
+import types
+
+import pytest
+
+import ExtractorPatternAgent.generated_extractors as registry
+from ExtractorPatternAgent.generated_extractors import _LazyModule
+
+
+class TestLazyModule:
+    """Test the _LazyModule import proxy."""
+
+    def test_name_does_not_import(self):
+        """Test that __name__ and repr are available before the import."""
+        proxy = _LazyModule(f"{registry._PACKAGE}.does_not_exist")
+
+        assert proxy.__name__ == f"{registry._PACKAGE}.does_not_exist"
+        assert "not loaded" in repr(proxy)
+
+    def test_attribute_access_imports_module(self):
+        """Test that the first attribute access imports the real module."""
+        proxy = _LazyModule(f"{registry._PACKAGE}.power_no")
+
+        assert proxy.PATTERN_METADATA["domain"] == "power.no"
+        assert callable(proxy.extract_price)
+        assert "(loaded)" in repr(proxy)
+
+    def test_failed_import_is_remembered(self, monkeypatch):
+        """Test that a failed import is re-raised without importing again."""
+        imported = []
+
+        def failing_import(module_path):
+            imported.append(module_path)
+            raise ImportError(f"No module named {module_path!r}")
+
+        monkeypatch.setattr(registry, "_cached_import", failing_import)
+        proxy = _LazyModule(f"{registry._PACKAGE}.does_not_exist")
+
+        with pytest.raises(ImportError):
+            proxy.extract_price
+        with pytest.raises(ImportError):
+            proxy.extract_price
+        assert imported == [f"{registry._PACKAGE}.does_not_exist"]
+        assert "failed to load" in repr(proxy)
+
+
+class TestBrokenExtractor:
+    """Test a registered extractor whose module fails to import."""
+
+    @pytest.fixture
+    def broken(self, monkeypatch):
+        """Register broken.example with a proxy for a missing module."""
+        monkeypatch.setitem(
+            registry._registry._extractors,
+            "broken.example",
+            _LazyModule(f"{registry._PACKAGE}.does_not_exist"),
+        )
+
+    def test_has_parser_is_false(self, broken):
+        """Test that has_parser does not report an unimportable extractor."""
+        assert registry.has_parser("broken.example") is False
+
+    def test_reported_as_load_failure(self, broken):
+        """Test that extract_from_html reports the import, not a parse error."""
+        result = registry.extract_from_html("broken.example", "<html></html>")
+
+        assert len(result.errors) == 1
+        assert result.errors[0].startswith("Failed to load extractor: ")
+
+
+class TestManifestDiscovery:
+    """Test discovery from the versions.json manifest."""
+
+    @pytest.fixture
+    def manifest(self, tmp_path, monkeypatch):
+        """Point the registry at a manifest file under tmp_path."""
+        path = tmp_path / "versions.json"
+        monkeypatch.setattr(registry, "_MANIFEST_PATH", path)
+        return path
+
+    def test_manifest_hit_skips_file_scan(self, manifest, monkeypatch):
+        """Test that listed modules are registered without scanning the package."""
+        manifest.write_text(
+            json.dumps({"power_no": {"domain": "power.no", "module": "power_no"}})
+        )
+        reg = registry.ExtractorRegistry()
+        monkeypatch.setattr(
+            reg, "_discover_from_files", lambda: pytest.fail("package was scanned")
+        )
+
+        assert reg.list_domains() == ["power.no"]
+        extractor = reg.get_extractor("power.no")
+        assert isinstance(extractor, _LazyModule)
+        assert extractor.__name__ == f"{registry._PACKAGE}.power_no"
+
+    def test_missing_manifest_falls_back_to_file_scan(self, manifest):
+        """Test that every module is found by scanning when there is no manifest."""
+        reg = registry.ExtractorRegistry()
+
+        domains = reg.list_domains()
+
+        assert "power.no" in domains
+        assert "komplett.no" in domains
+
+    def test_unreadable_manifest_falls_back_to_file_scan(self, manifest):
+        """Test that a corrupt manifest is ignored in favour of the file scan."""
+        manifest.write_text("{not json")
+        reg = registry.ExtractorRegistry()
+
+        assert "komplett.no" in reg.list_domains()
+
+    def test_stale_manifest(self, manifest):
+        """Test that stale entries are skipped and unlisted modules still resolve."""
+        manifest.write_text(json.dumps({
+            "power_no": {"domain": "power.no"},
+            "gone_com": {"domain": "gone.com"},
+        }))
+        reg = registry.ExtractorRegistry()
+
+        assert reg.list_domains() == ["power.no"]
+        assert reg.get_extractor("gone.com") is None
+        extractor = reg.get_extractor("komplett.no")
+        assert extractor.__name__ == f"{registry._PACKAGE}.komplett_no"
+
+
+def _power_page(price: str) -> str:
+    return (
+        '<html><head><script type="application/ld+json">'
+        '{"@type": "Product", "name": "Kettle", "offers": {"price": "%s"}}'
+        "</script></head><body></body></html>" % price
+    )
+
+
+class TestExtractMany:
+    """Test batch extraction with extract_many."""
+
+    def test_results_keep_input_order(self):
+        """Test that results line up with the input pairs."""
+        prices = [str(100 + i) for i in range(20)]
+
+        results = registry.extract_many(
+            [("power.no", _power_page(price)) for price in prices], max_workers=4
+        )
+
+        assert [str(r.price) for r in results] == prices
+
+    def test_unknown_domain_gives_error_result(self):
+        """Test that an unknown domain yields a failed result, not an exception."""
+        results = registry.extract_many(
+            [("power.no", _power_page("199")), ("unknown.example", "<html></html>")]
+        )
+
+        assert results[0].success
+        assert results[1].domain == "unknown.example"
+        assert not results[1].success
+        assert results[1].errors == ["No extractor found for domain: unknown.example"]
+
+    def test_failing_extractor_gives_error_result(self, monkeypatch):
+        """Test that an extractor exception is recorded on its own result."""
+        module = registry.get_parser("power.no")
+
+        def fail(soup):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(module._load(), "extract_price", fail)
+
+        results = registry.extract_many(
+            [("power.no", _power_page("199")), ("power.no", _power_page("299"))]
+        )
+
+        assert len(results) == 2
+        for result in results:
+            assert result.price is None
+            assert result.errors == ["Price extraction failed: boom"]
+            assert result.title == "Kettle"
+
+    def test_default_workers_are_capped(self, monkeypatch):
+        """Test that the default pool never exceeds _MAX_DEFAULT_WORKERS."""
+        created = []
+
+        class RecordingExecutor(registry.ThreadPoolExecutor):
+            def __init__(self, max_workers):
+                created.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(registry, "ThreadPoolExecutor", RecordingExecutor)
+        monkeypatch.setattr(registry.os, "cpu_count", lambda: 64)
+
+        registry.extract_many([("power.no", _power_page("199"))] * 50)
+
+        assert created == [registry._MAX_DEFAULT_WORKERS]
+
+
+class TestMetadata:
+    """Test reading PATTERN_METADATA from module source."""
+
+    @pytest.mark.parametrize(
+        "path",
+        sorted(p for p in registry._PACKAGE_DIR.glob("*.py") if not p.stem.startswith("_")),
+        ids=lambda p: p.stem,
+    )
+    def test_matches_imported_metadata(self, path):
+        """Test that the parsed metadata equals the module's own."""
+        module = importlib.import_module(f"{registry._PACKAGE}.{path.stem}")
+
+        assert registry._read_metadata(path) == module.PATTERN_METADATA
+
+    def test_annotated_assignment(self, tmp_path):
+        """Test that an annotated PATTERN_METADATA is read."""
+        path = tmp_path / "shop_no.py"
+        path.write_text('PATTERN_METADATA: dict = {"domain": "shop.no"}\n')
+
+        assert registry._read_metadata(path) == {"domain": "shop.no"}
+
+    def test_missing_metadata(self, tmp_path):
+        """Test that a module without PATTERN_METADATA gives None."""
+        path = tmp_path / "shop_no.py"
+        path.write_text('DOMAIN = "shop.no"\n')
+
+        assert registry._read_metadata(path) is None
+
+    def test_non_literal_metadata_is_imported(self, tmp_path, monkeypatch):
+        """Test that non-literal metadata falls back to importing the module."""
+        path = tmp_path / "shop_no.py"
+        path.write_text('DOMAIN = "shop.no"\nPATTERN_METADATA = {"domain": DOMAIN}\n')
+        imported = []
+
+        def fake_import(module_path):
+            imported.append(module_path)
+            return types.SimpleNamespace(PATTERN_METADATA={"domain": "shop.no"})
+
+        monkeypatch.setattr(registry, "_PACKAGE_DIR", tmp_path)
+        monkeypatch.setattr(registry, "_cached_import", fake_import)
+        reg = registry.ExtractorRegistry()
+
+        with pytest.raises(ValueError):
+            registry._read_metadata(path)
+        assert reg.get_metadata("shop_no") == {"domain": "shop.no"}
+        assert reg.get_metadata("shop_no") == {"domain": "shop.no"}
+        assert imported == [f"{registry._PACKAGE}.shop_no"]
+
+
+class TestGetExtractor:
+    """Test domain lookups."""
+
+    def test_miss_is_cached(self, monkeypatch):
+        """Test that an unknown domain is only resolved by filename once."""
+        reg = registry.ExtractorRegistry()
+        calls = []
+        load_domain = reg._load_domain
+        monkeypatch.setattr(
+            reg, "_load_domain", lambda domain: calls.append(domain) or load_domain(domain)
+        )
+
+        assert reg.get_extractor("unknown.example") is None
+        assert reg.get_extractor("www.unknown.example") is None
+
+        assert calls == ["unknown.example"]
+
+    def test_reload_forgets_misses(self):
+        """Test that reload() resolves previously missing domains again."""
+        reg = registry.ExtractorRegistry()
+        reg.get_extractor("unknown.example")
+
+        reg.reload()
+
+        assert reg._missing == set()
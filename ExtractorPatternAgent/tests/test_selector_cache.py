@@ -0,0 +1,129 @@
+"""Tests for SelectorCache."""
+
+import pytest
+import soupsieve as sv
+
+from ExtractorPatternAgent.generated_extractors._base import (
+    BaseExtractor,
+    SelectorCache,
+    _index_key,
+)
+
+
+PAGE = """<html>
+<head><title>Kettle</title></head>
+<body>
+  <div id="main" class="product">
+    <h1>Site header</h1>
+    <div class="a gallery">
+      <span class="price old">199,-</span>
+      <img src="/thumb.jpg" data-zoom="/zoom.jpg">
+    </div>
+    <h1 class="product-title main">Kettle 1.7 L</h1>
+    <div class="a">
+      <p class="b">Text <img class="hero" src="/hero.jpg"></p>
+    </div>
+    <span class="price">149,-</span>
+    <span class="price current" data-price="149">149,-</span>
+    <ul><li>one</li><li class="b">two</li></ul>
+  </div>
+  <div class="PRODUCT">case</div>
+</body>
+</html>"""
+
+INDEXED = [
+    # tag selectors
+    "h1",
+    "span",
+    "img",
+    "section",
+    # .class selectors
+    ".price",
+    ".current",
+    ".b",
+    ".missing",
+    ".PRODUCT",
+    # compound selectors
+    "h1.product-title",
+    "span.price.current",
+    "span.price[data-price]",
+    "li.b",
+    "p.price",
+    # descendant and child selectors
+    ".a img",
+    ".a > img",
+    "div.a p img.hero",
+    ".gallery .price",
+    "ul li:nth-child(2)",
+    "#main h1",
+    # selector lists sharing one subject
+    "h1.main, h1.product-title",
+]
+
+FALLBACK = [
+    # #id and attribute-only selectors
+    "#main",
+    "[data-price]",
+    "[data-zoom]",
+    '[src$="hero.jpg"]',
+    # universal, pseudo-class and mixed-subject selectors
+    "*",
+    ":root",
+    "span, h1",
+    ".price, .b",
+    ":is(h1, span)",
+]
+
+
+class Stub:
+    """Hashable stand-in for soupsieve selector internals."""
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+
+@pytest.fixture
+def soup():
+    return BaseExtractor.parse_html(PAGE)
+
+
+class TestSelectFirst:
+    """Test that select_first answers like select_one."""
+
+    @pytest.mark.parametrize("css", INDEXED + FALLBACK)
+    def test_matches_select_one(self, soup, css):
+        """Test select_first against soupsieve's select_one."""
+        selector = sv.compile(css)
+
+        assert SelectorCache.for_soup(soup).select_first(selector) is selector.select_one(soup)
+
+    def test_matches_after_index_is_built(self, soup):
+        """Test every selector on one cache, so later calls reuse the index."""
+        ctx = SelectorCache.for_soup(soup)
+
+        for css in INDEXED + FALLBACK:
+            selector = sv.compile(css)
+            assert ctx.select_first(selector) is selector.select_one(soup), css
+
+    @pytest.mark.parametrize("css", INDEXED)
+    def test_indexed_selectors_have_a_key(self, css):
+        """Test that tag, class, compound and descendant selectors use the index."""
+        assert _index_key(sv.compile(css)) is not None
+
+    @pytest.mark.parametrize("css", FALLBACK)
+    def test_other_selectors_fall_back(self, css):
+        """Test that #id, attribute-only and mixed selectors walk the tree."""
+        assert _index_key(sv.compile(css)) is None
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            object(),
+            Stub(selectors=None),
+            Stub(selectors=[Stub(tag=None)]),
+        ],
+        ids=["no selectors", "not iterable", "missing attributes"],
+    )
+    def test_unknown_selector_shape_falls_back(self, selector):
+        """Test that selector internals of an unexpected shape walk the tree."""
+        assert _index_key(selector) is None
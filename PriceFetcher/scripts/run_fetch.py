@@ -144,6 +144,7 @@ async def main():
         browser_timeout=config["fetcher"].get("browser_timeout", 60.0),
         wait_for_js=config["fetcher"].get("wait_for_js", True),
         domain_delays=config["fetcher"].get("domain_delays", {}),
+        max_concurrent_domains=config["fetcher"].get("max_concurrent_domains", 4),
     )
 
     try:
@@ -78,6 +78,7 @@ async def fetch_listing_price_direct(
             browser_timeout=config["fetcher"].get("browser_timeout", 60.0),
             wait_for_js=config["fetcher"].get("wait_for_js", True),
             domain_delays=config["fetcher"].get("domain_delays", {}),
+            max_concurrent_domains=config["fetcher"].get("max_concurrent_domains", 4),
         )
 
         # Get product by listing ID
@@ -188,6 +189,7 @@ async def fetch_all_due_prices(
             browser_timeout=config["fetcher"].get("browser_timeout", 60.0),
             wait_for_js=config["fetcher"].get("wait_for_js", True),
             domain_delays=config["fetcher"].get("domain_delays", {}),
+            max_concurrent_domains=config["fetcher"].get("max_concurrent_domains", 4),
         )
 
         # Fetch all due products
@@ -38,6 +38,7 @@ class PriceFetcher:
         browser_timeout: float = 60.0,
         wait_for_js: bool = True,
         domain_delays: Optional[Dict[str, float]] = None,
+        max_concurrent_domains: int = 4,
     ):
         """
         Initialize price fetcher.
@@ -51,6 +52,10 @@ class PriceFetcher:
             browser_timeout: Navigation timeout for browser (seconds)
             wait_for_js: Whether to wait for JavaScript to finish rendering
             domain_delays: Per-domain request delays (seconds)
+            max_concurrent_domains: Domains fetched in parallel by fetch_all
+                (requests to the same domain stay sequential and rate limited).
+                Each fetch launches its own Chromium, so this also caps how
+                many browsers run at once
         """
         self.request_delay = request_delay
         self.timeout = timeout
@@ -58,6 +63,7 @@ class PriceFetcher:
         self.browser_timeout = browser_timeout * 1000  # Convert to milliseconds
         self.wait_for_js = wait_for_js
         self.domain_delays = domain_delays or {}
+        self.max_concurrent_domains = max(1, max_concurrent_domains)
 
         # Initialize components
         self.extractor = Extractor()
@@ -71,6 +77,7 @@ class PriceFetcher:
             max_retries=max_retries,
             browser_timeout=browser_timeout,
             wait_for_js=wait_for_js,
+            max_concurrent_domains=self.max_concurrent_domains,
         )
 
     async def fetch_all(self) -> FetchSummary:
@@ -111,30 +118,38 @@ class PriceFetcher:
             domains=len(by_domain),
         )
 
-        # Fetch products by domain
-        fetch_results: List[FetchResult] = []
-        success_count = 0
-        failed_count = 0
-
-        for domain, domain_products in by_domain.items():
-            logger.info("processing_domain", domain=domain, products=len(domain_products))
-
-            # Fetch each product with rate limiting
-            for i, product in enumerate(domain_products):
-                result = await self.fetch_product(product)
-                fetch_results.append(result)
-
-                if result.success:
-                    success_count += 1
-                else:
-                    failed_count += 1
+        # Fetch products by domain: domains run concurrently (bounded), while
+        # each domain's products are fetched one at a time with rate limiting.
+        # _fetch_html starts a fresh browser per fetch, so the semaphore also
+        # bounds how many Chromium processes are alive at once
+        semaphore = asyncio.Semaphore(self.max_concurrent_domains)
+
+        async def fetch_domain(domain: str, domain_products: List[Product]) -> List[FetchResult]:
+            async with semaphore:
+                logger.info("processing_domain", domain=domain, products=len(domain_products))
+
+                results: List[FetchResult] = []
+                for i, product in enumerate(domain_products):
+                    results.append(await self.fetch_product(product))
+
+                    # Rate limiting: wait between requests (except for last product)
+                    if i < len(domain_products) - 1:
+                        # Use domain-specific delay if configured, otherwise use default
+                        delay = self.domain_delays.get(domain, self.request_delay)
+                        logger.debug("rate_limit_delay", domain=domain, delay=delay)
+                        await asyncio.sleep(delay)
+                return results
+
+        domain_results = await asyncio.gather(
+            *(fetch_domain(domain, domain_products) for domain, domain_products in by_domain.items())
+        )
 
-                # Rate limiting: wait between requests (except for last product)
-                if i < len(domain_products) - 1:
-                    # Use domain-specific delay if configured, otherwise use default
-                    delay = self.domain_delays.get(domain, self.request_delay)
-                    logger.debug("rate_limit_delay", domain=domain, delay=delay)
-                    await asyncio.sleep(delay)
+        # Flatten in domain order (same order as the sequential loop)
+        fetch_results: List[FetchResult] = [
+            result for results in domain_results for result in results
+        ]
+        success_count = sum(1 for result in fetch_results if result.success)
+        failed_count = len(fetch_results) - success_count
 
         completed_at = datetime.utcnow()
         duration = (completed_at - started_at).total_seconds()
@@ -232,8 +247,11 @@ class PriceFetcher:
             except Exception as e:
                 logger.warning("artifact_upload_failed", url=url, error=str(e))
 
-            # Extract data using Python extractor
-            extraction, extractor_module = self.extractor.extract_with_domain(html, product.domain)
+            # Extract data using Python extractor; parsing is CPU-bound, so it runs
+            # on a worker thread while other domains' browsers keep loading
+            extraction, extractor_module = await asyncio.to_thread(
+                self.extractor.extract_with_domain, html, product.domain
+            )
 
             # Get previous extraction for comparison
             previous = self.storage.get_latest_price(
@@ -0,0 +1,120 @@
+"""Tests for the fetcher's concurrent fetch run."""
+
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from src.fetcher import PriceFetcher
+from src.models import ExtractedField, ExtractionResult, Product
+
+
+class FakeStorage:
+    """In-memory stand-in for PriceStorage."""
+
+    def __init__(self, products):
+        self.products = products
+
+    def get_products_to_fetch(self):
+        return self.products
+
+    def get_latest_price(self, product_id, listing_id=None):
+        return None
+
+    def save_price(self, *args, **kwargs):
+        pass
+
+    def update_last_checked(self, listing_id):
+        pass
+
+
+class FakeExtractor:
+    """Extractor that finds a valid price on every page."""
+
+    def has_extractor(self, domain):
+        return True
+
+    def extract_with_domain(self, html, domain):
+        extraction = ExtractionResult(
+            price=ExtractedField(value="$29.99", method="css", confidence=0.9)
+        )
+        return extraction, domain.replace(".", "_")
+
+
+class TestFetchAll:
+    """Test fetch_all across domains."""
+
+    @pytest.fixture
+    def products(self):
+        """Three products on each of five domains, interleaved."""
+        return [
+            Product(
+                product_id=f"{domain}-{i}",
+                url=f"https://{domain}/product/{i}",
+                domain=domain,
+            )
+            for i in range(3)
+            for domain in ("a.no", "b.no", "c.no", "d.no", "e.no")
+        ]
+
+    @pytest.fixture
+    def fetcher(self, products, tmp_path):
+        """Fetcher with fake storage and extractor and a recording _fetch_html."""
+        fetcher = PriceFetcher(
+            db_path=str(tmp_path / "db.sqlite3"),
+            request_delay=0.0,
+            max_concurrent_domains=2,
+        )
+        fetcher.storage = FakeStorage(products)
+        fetcher.extractor = FakeExtractor()
+
+        fetcher.calls = []
+        fetcher.active_domains = set()
+        fetcher.max_active = 0
+        fetcher.overlaps = defaultdict(int)
+
+        async def fake_fetch_html(url):
+            domain = url.split("/")[2]
+            if domain in fetcher.active_domains:
+                fetcher.overlaps[domain] += 1
+            fetcher.active_domains.add(domain)
+            fetcher.max_active = max(fetcher.max_active, len(fetcher.active_domains))
+            fetcher.calls.append(url)
+            try:
+                await asyncio.sleep(0.01)
+                return "<html></html>", None
+            finally:
+                fetcher.active_domains.discard(domain)
+
+        fetcher._fetch_html = fake_fetch_html
+        return fetcher
+
+    async def test_concurrency_limit(self, fetcher):
+        """Test that no more than max_concurrent_domains domains load at once."""
+        summary = await fetcher.fetch_all()
+
+        assert summary.total == 15
+        assert summary.success == 15
+        assert fetcher.max_active == 2
+
+    async def test_per_domain_order(self, fetcher):
+        """Test that each domain's products are fetched one at a time, in order."""
+        await fetcher.fetch_all()
+
+        by_domain = defaultdict(list)
+        for url in fetcher.calls:
+            by_domain[url.split("/")[2]].append(url)
+
+        assert not fetcher.overlaps
+        for domain, urls in by_domain.items():
+            assert urls == [f"https://{domain}/product/{i}" for i in range(3)]
+
+    async def test_results_in_domain_order(self, fetcher):
+        """Test that results are grouped by domain like the sequential loop."""
+        summary = await fetcher.fetch_all()
+
+        assert [result.product_id for result in summary.products] == [
+            f"{domain}-{i}"
+            for domain in ("a.no", "b.no", "c.no", "d.no", "e.no")
+            for i in range(3)
+        ]